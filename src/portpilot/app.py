@@ -1,19 +1,25 @@
 """PortPilot application entry and setup."""
 
 import sys
+from concurrent.futures import ThreadPoolExecutor
 
-from PySide6.QtCore import Qt
-from PySide6.QtGui import QFont, QIcon
-from PySide6.QtWidgets import QApplication
-
-from .core.db import init_db
+from .core.db import close_db, init_db, optimize_db
 from .core.settings import ensure_app_dirs, get_icon_path
-from .ui.main_window import MainWindow
 
 
 def main() -> int:
     ensure_app_dirs()
-    init_db()
+    # Schema setup only touches the DB file, so run it while Qt is imported.
+    pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="PortPilotInit")
+    db_ready = pool.submit(init_db)
+    pool.shutdown(wait=False)
+
+    from PySide6.QtCore import Qt
+    from PySide6.QtGui import QFont, QIcon
+    from PySide6.QtWidgets import QApplication
+
+    from .ui.main_window import MainWindow
+    from .ui.widgets import app_stylesheet
 
     app = QApplication(sys.argv)
     app.setApplicationName("PortPilot")
@@ -29,10 +35,16 @@ def main() -> int:
 
     font = QFont("Segoe UI", 10)
     app.setFont(font)
+    # Parsed once here; widgets opt in by object name instead of per-widget setStyleSheet
+    app.setStyleSheet(app_stylesheet())
 
+    db_ready.result()  # re-raises if init_db failed
     window = MainWindow()
     if icon_path:
         window.setWindowIcon(QIcon(str(icon_path)))
     window.show()
 
-    return app.exec()
+    ret = app.exec()
+    optimize_db()
+    close_db()
+    return ret
@@ -1,355 +1,577 @@
-"""SQLite DAL for PortPilot."""
+"""SQLite DAL for PortPilot.
 
+Reads run synchronously on a shared query-only connection. Writes are queued
+to a DbWriter thread that owns the write connection; reads first wait for
+any queued writes so callers always see their own changes.
+"""
+
+import logging
 import sqlite3
+import threading
+import time
+from concurrent.futures import Future
 from pathlib import Path
-from typing import Optional
+from typing import Any, Callable, Iterator, Optional
 
+from .db_writer import DbWriter
 from .models import Host, Tunnel, Run
 from .settings import ensure_app_dirs, get_db_path
 
 
-def _connect() -> sqlite3.Connection:
+_conn: Optional[sqlite3.Connection] = None
+_writer: Optional[DbWriter] = None
+# Serializes access to the shared read connection; DAL calls may come from worker threads.
+_lock = threading.RLock()
+
+_log = logging.getLogger(__name__)
+
+
+def _open_connection() -> sqlite3.Connection:
     ensure_app_dirs()
-    conn = sqlite3.connect(get_db_path())
-    conn.row_factory = sqlite3.Row
+    # The driver keeps compiled statements keyed by SQL text; with long-lived
+    # connections the hot point queries are prepared once and reused.
+    conn = sqlite3.connect(get_db_path(), check_same_thread=False, cached_statements=256)
+    # Per-connection settings; journal_mode is persistent and set once in init_db.
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute("PRAGMA temp_store=MEMORY")
+    conn.execute("PRAGMA cache_size=-64000")
+    conn.execute("PRAGMA busy_timeout=5000")
+    conn.execute("PRAGMA foreign_keys=ON")
     return conn
 
 
+def _connect() -> sqlite3.Connection:
+    """Return the shared read connection once pending writes are committed. Call with _lock held."""
+    global _conn
+    if _writer is not None:
+        _writer.wait_idle()
+    if _conn is None:
+        conn = _open_connection()
+        conn.execute("PRAGMA query_only=ON")
+        _conn = conn
+    return _conn
+
+
+def _submit(fn: Callable[..., Any], *args: Any) -> Future:
+    """Queue fn(conn, *args) on the writer thread, starting it on first use."""
+    global _writer
+    with _lock:
+        if _writer is None:
+            _writer = DbWriter(_open_connection)
+            _writer.start()
+        return _writer.submit(fn, *args)
+
+
+def _submit_unwaited(fn: Callable[..., Any], *args: Any) -> Future:
+    """_submit for callers that never read the result: a failed write is logged rather than lost."""
+    fut = _submit(fn, *args)
+
+    def log_failure(f: Future) -> None:
+        exc = f.exception()
+        if exc is not None:
+            _log.error("Database write %s%r failed", fn.__name__, args, exc_info=exc)
+
+    fut.add_done_callback(log_failure)
+    return fut
+
+
+def close_db() -> None:
+    """Commit queued writes and close both connections. Call on shutdown."""
+    global _conn, _writer
+    with _lock:
+        if _writer is not None:
+            _writer.stop()
+            _writer = None
+        if _conn is not None:
+            _conn.close()
+            _conn = None
+
+
+# Bumped when the on-disk schema changes; stored in PRAGMA user_version.
+SCHEMA_VERSION = 1
+
+# Timestamps are INTEGER Unix epoch seconds (UTC).
+_TABLES = {
+    "hosts": """
+        CREATE TABLE IF NOT EXISTS {name} (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            name TEXT NOT NULL,
+            username TEXT NOT NULL,
+            hostname TEXT NOT NULL,
+            port INTEGER NOT NULL DEFAULT 22,
+            identity_file TEXT,
+            extra_args TEXT,
+            keepalive_interval INTEGER DEFAULT 0,
+            keepalive_countmax INTEGER DEFAULT 0,
+            created_at INTEGER,
+            updated_at INTEGER
+        )""",
+    "tunnels": """
+        CREATE TABLE IF NOT EXISTS {name} (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            host_id INTEGER NOT NULL REFERENCES hosts(id) ON DELETE CASCADE,
+            name TEXT NOT NULL,
+            type TEXT NOT NULL,
+            local_bind TEXT,
+            local_port INTEGER,
+            remote_host TEXT,
+            remote_port INTEGER,
+            remote_bind TEXT,
+            socks_port INTEGER,
+            open_terminal INTEGER DEFAULT 0,
+            created_at INTEGER,
+            updated_at INTEGER
+        )""",
+    "runs": """
+        CREATE TABLE IF NOT EXISTS {name} (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            tunnel_id INTEGER NOT NULL REFERENCES tunnels(id) ON DELETE CASCADE,
+            started_at INTEGER NOT NULL,
+            stopped_at INTEGER,
+            pid INTEGER,
+            mode TEXT NOT NULL,
+            exit_code INTEGER,
+            log_path TEXT,
+            last_error TEXT
+        )""",
+}
+
+# Columns that held ISO-8601 TEXT before schema version 1.
+_TIMESTAMP_COLUMNS = {
+    "hosts": ("created_at", "updated_at"),
+    "tunnels": ("created_at", "updated_at"),
+    "runs": ("started_at", "stopped_at"),
+}
+
+
+def _migrate_text_timestamps(conn: sqlite3.Connection) -> None:
+    """Rebuild pre-v1 tables, converting ISO-8601 TEXT timestamps to epoch integers."""
+    # Table rebuilds must run with foreign keys off; the pragma is a no-op inside a transaction.
+    conn.execute("PRAGMA foreign_keys=OFF")
+    try:
+        conn.execute("BEGIN")
+        for table, ddl in _TABLES.items():
+            cols = [r[1] for r in conn.execute(f"PRAGMA table_info({table})")]
+            exprs = [
+                f"CAST(strftime('%s', {c}) AS INTEGER)" if c in _TIMESTAMP_COLUMNS[table] else c
+                for c in cols
+            ]
+            conn.execute(ddl.format(name=f"{table}_new"))
+            conn.execute(
+                f"INSERT INTO {table}_new ({', '.join(cols)}) SELECT {', '.join(exprs)} FROM {table}"
+            )
+            conn.execute(f"DROP TABLE {table}")
+            conn.execute(f"ALTER TABLE {table}_new RENAME TO {table}")
+        conn.execute("COMMIT")
+    except Exception:
+        conn.execute("ROLLBACK")
+        raise
+    finally:
+        conn.execute("PRAGMA foreign_keys=ON")
+
+
 def init_db() -> None:
-    """Create tables if they don't exist."""
-    conn = _connect()
+    """Create tables if they don't exist and migrate older schemas."""
+    conn = _open_connection()
     try:
-        conn.executescript("""
-            CREATE TABLE IF NOT EXISTS hosts (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                name TEXT NOT NULL,
-                username TEXT NOT NULL,
-                hostname TEXT NOT NULL,
-                port INTEGER NOT NULL DEFAULT 22,
-                identity_file TEXT,
-                extra_args TEXT,
-                keepalive_interval INTEGER DEFAULT 0,
-                keepalive_countmax INTEGER DEFAULT 0,
-                created_at TEXT,
-                updated_at TEXT
-            );
-
-            CREATE TABLE IF NOT EXISTS tunnels (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                host_id INTEGER NOT NULL REFERENCES hosts(id) ON DELETE CASCADE,
-                name TEXT NOT NULL,
-                type TEXT NOT NULL,
-                local_bind TEXT,
-                local_port INTEGER,
-                remote_host TEXT,
-                remote_port INTEGER,
-                remote_bind TEXT,
-                socks_port INTEGER,
-                open_terminal INTEGER DEFAULT 0,
-                created_at TEXT,
-                updated_at TEXT
-            );
-
-            CREATE TABLE IF NOT EXISTS runs (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                tunnel_id INTEGER NOT NULL REFERENCES tunnels(id) ON DELETE CASCADE,
-                started_at TEXT NOT NULL,
-                stopped_at TEXT,
-                pid INTEGER,
-                mode TEXT NOT NULL,
-                exit_code INTEGER,
-                log_path TEXT,
-                last_error TEXT
-            );
-
-            CREATE INDEX IF NOT EXISTS idx_tunnels_host ON tunnels(host_id);
-            CREATE INDEX IF NOT EXISTS idx_runs_tunnel ON runs(tunnel_id);
-        """)
+        if str(get_db_path()) != ":memory:":
+            # WAL: readers don't block the writer and commits need fewer fsyncs.
+            conn.execute("PRAGMA journal_mode=WAL")
+        version = conn.execute("PRAGMA user_version").fetchone()[0]
+        has_tables = conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type='table' AND name='hosts'"
+        ).fetchone()
+        if has_tables and version < 1:
+            _migrate_text_timestamps(conn)
+        for table, ddl in _TABLES.items():
+            conn.execute(ddl.format(name=table))
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_tunnels_host ON tunnels(host_id)")
+        # Serves get_latest_run with one index seek; supersedes the old runs(tunnel_id) index.
+        conn.execute("DROP INDEX IF EXISTS idx_runs_tunnel")
+        conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_runs_tunnel_started ON runs(tunnel_id, started_at DESC, id DESC)"
+        )
+        conn.execute(f"PRAGMA user_version={SCHEMA_VERSION}")
         conn.commit()
     finally:
         conn.close()
 
 
-def _now() -> str:
-    from datetime import datetime
-    return datetime.utcnow().isoformat() + "Z"
+def _do_optimize(conn: sqlite3.Connection) -> None:
+    conn.execute("PRAGMA optimize")
+
+
+def optimize_db() -> None:
+    """Let SQLite refresh query planner statistics. Call on shutdown."""
+    _submit(_do_optimize).result()
+
+
+def _now() -> int:
+    """Current time as Unix epoch seconds."""
+    return int(time.time())
 
 
 # --- Hosts ---
 
-def list_hosts(search: str = "") -> list[Host]:
-    conn = _connect()
-    try:
+# Rows come back as plain tuples; SELECTs list columns explicitly so the
+# positional indexes in the _row_to_* helpers don't depend on table layout.
+_HOST_COLUMNS = (
+    "id, name, username, hostname, port, identity_file, extra_args,"
+    " keepalive_interval, keepalive_countmax, created_at, updated_at"
+)
+
+def _host_rows(search: str) -> list[tuple]:
+    with _lock:
+        conn = _connect()
         if search.strip():
             cur = conn.execute(
-                "SELECT * FROM hosts WHERE name LIKE ? OR hostname LIKE ? ORDER BY name",
+                f"SELECT {_HOST_COLUMNS} FROM hosts WHERE name LIKE ? OR hostname LIKE ? ORDER BY name",
                 (f"%{search}%", f"%{search}%"),
             )
         else:
-            cur = conn.execute("SELECT * FROM hosts ORDER BY name")
-        return [_row_to_host(r) for r in cur.fetchall()]
-    finally:
-        conn.close()
+            cur = conn.execute(f"SELECT {_HOST_COLUMNS} FROM hosts ORDER BY name")
+        return cur.fetchall()
+
+
+def iter_hosts(search: str = "") -> Iterator[Host]:
+    """Yield hosts, building each Host on demand. Rows are fetched first, so no lock is held between yields."""
+    for r in _host_rows(search):
+        yield _row_to_host(r)
+
+
+def list_hosts(search: str = "") -> list[Host]:
+    return [_row_to_host(r) for r in _host_rows(search)]
 
 
 def get_host(host_id: int) -> Optional[Host]:
-    conn = _connect()
-    try:
-        cur = conn.execute("SELECT * FROM hosts WHERE id = ?", (host_id,))
+    with _lock:
+        conn = _connect()
+        cur = conn.execute(f"SELECT {_HOST_COLUMNS} FROM hosts WHERE id = ?", (host_id,))
         row = cur.fetchone()
         return _row_to_host(row) if row else None
-    finally:
-        conn.close()
 
 
-def _row_to_host(row: sqlite3.Row) -> Host:
+def _row_to_host(row: tuple) -> Host:
     return Host(
-        id=row["id"],
-        name=row["name"],
-        username=row["username"],
-        hostname=row["hostname"],
-        port=row["port"],
-        identity_file=row["identity_file"] or "",
-        extra_args=row["extra_args"] or "",
-        keepalive_interval=row["keepalive_interval"] or 0,
-        keepalive_countmax=row["keepalive_countmax"] or 0,
-        created_at=row["created_at"],
-        updated_at=row["updated_at"],
+        id=row[0],
+        name=row[1],
+        username=row[2],
+        hostname=row[3],
+        port=row[4],
+        identity_file=row[5] or "",
+        extra_args=row[6] or "",
+        keepalive_interval=row[7] or 0,
+        keepalive_countmax=row[8] or 0,
+        created_at=row[9],
+        updated_at=row[10],
     )
 
 
+_INSERT_HOST_SQL = """INSERT INTO hosts (name, username, hostname, port, identity_file, extra_args,
+    keepalive_interval, keepalive_countmax, created_at, updated_at)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)"""
+
+
+def _host_insert_params(h: Host) -> tuple:
+    now = _now()
+    return (
+        h.name,
+        h.username,
+        h.hostname,
+        h.port,
+        h.identity_file or None,
+        h.extra_args or None,
+        h.keepalive_interval,
+        h.keepalive_countmax,
+        now,
+        now,
+    )
+
+
+def _do_insert_host(conn: sqlite3.Connection, h: Host) -> int:
+    return conn.execute(_INSERT_HOST_SQL, _host_insert_params(h)).lastrowid
+
+
 def insert_host(h: Host) -> int:
-    conn = _connect()
-    try:
-        cur = conn.execute(
-            """INSERT INTO hosts (name, username, hostname, port, identity_file, extra_args,
-               keepalive_interval, keepalive_countmax, created_at, updated_at)
-               VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
-            (
-                h.name,
-                h.username,
-                h.hostname,
-                h.port,
-                h.identity_file or None,
-                h.extra_args or None,
-                h.keepalive_interval,
-                h.keepalive_countmax,
-                _now(),
-                _now(),
-            ),
-        )
-        conn.commit()
-        return cur.lastrowid
-    finally:
-        conn.close()
+    return _submit(_do_insert_host, h).result()
+
+
+def _do_insert_hosts_bulk(conn: sqlite3.Connection, hs: list[Host]) -> None:
+    conn.executemany(_INSERT_HOST_SQL, [_host_insert_params(h) for h in hs])
+
+
+def insert_hosts_bulk(hs: list[Host]) -> None:
+    """Insert many hosts in one transaction (one commit instead of one per row)."""
+    _submit(_do_insert_hosts_bulk, hs).result()
+
+
+def _do_update_host(conn: sqlite3.Connection, h: Host) -> None:
+    conn.execute(
+        """UPDATE hosts SET name=?, username=?, hostname=?, port=?, identity_file=?,
+           extra_args=?, keepalive_interval=?, keepalive_countmax=?, updated_at=?
+           WHERE id=?""",
+        (
+            h.name,
+            h.username,
+            h.hostname,
+            h.port,
+            h.identity_file or None,
+            h.extra_args or None,
+            h.keepalive_interval,
+            h.keepalive_countmax,
+            _now(),
+            h.id,
+        ),
+    )
 
 
 def update_host(h: Host) -> None:
     if h.id is None:
         raise ValueError("Host must have id to update")
-    conn = _connect()
-    try:
-        conn.execute(
-            """UPDATE hosts SET name=?, username=?, hostname=?, port=?, identity_file=?,
-               extra_args=?, keepalive_interval=?, keepalive_countmax=?, updated_at=?
-               WHERE id=?""",
-            (
-                h.name,
-                h.username,
-                h.hostname,
-                h.port,
-                h.identity_file or None,
-                h.extra_args or None,
-                h.keepalive_interval,
-                h.keepalive_countmax,
-                _now(),
-                h.id,
-            ),
-        )
-        conn.commit()
-    finally:
-        conn.close()
+    _submit(_do_update_host, h).result()
+
+
+def _do_delete_host(conn: sqlite3.Connection, host_id: int) -> None:
+    conn.execute("DELETE FROM hosts WHERE id = ?", (host_id,))
 
 
 def delete_host(host_id: int) -> None:
-    conn = _connect()
-    try:
-        conn.execute("DELETE FROM hosts WHERE id = ?", (host_id,))
-        conn.commit()
-    finally:
-        conn.close()
+    _submit(_do_delete_host, host_id).result()
 
 
 # --- Tunnels ---
 
+_TUNNEL_COLUMNS = (
+    "id, host_id, name, type, local_bind, local_port, remote_host, remote_port,"
+    " remote_bind, socks_port, open_terminal, created_at, updated_at"
+)
+
+def _tunnel_rows(host_id: int) -> list[tuple]:
+    with _lock:
+        conn = _connect()
+        cur = conn.execute(f"SELECT {_TUNNEL_COLUMNS} FROM tunnels WHERE host_id = ? ORDER BY name", (host_id,))
+        return cur.fetchall()
+
+
+def iter_tunnels(host_id: int) -> Iterator[Tunnel]:
+    """Yield a host's tunnels, building each on demand. Rows are fetched first, so no lock is held between yields."""
+    for r in _tunnel_rows(host_id):
+        yield _row_to_tunnel(r)
+
+
 def list_tunnels(host_id: int) -> list[Tunnel]:
-    conn = _connect()
-    try:
-        cur = conn.execute("SELECT * FROM tunnels WHERE host_id = ? ORDER BY name", (host_id,))
-        return [_row_to_tunnel(r) for r in cur.fetchall()]
-    finally:
-        conn.close()
+    return [_row_to_tunnel(r) for r in _tunnel_rows(host_id)]
+
+
+def list_tunnels_with_latest_exit(host_id: int) -> list[tuple[Tunnel, Optional[int]]]:
+    """A host's tunnels, each paired with its latest run's exit code, in one query."""
+    with _lock:
+        conn = _connect()
+        # Correlated lookup walks idx_runs_tunnel_started, same order as get_latest_run
+        cur = conn.execute(
+            f"SELECT {_TUNNEL_COLUMNS}, (SELECT r.exit_code FROM runs r WHERE r.tunnel_id = tunnels.id"
+            " ORDER BY r.started_at DESC, r.id DESC LIMIT 1)"
+            " FROM tunnels WHERE host_id = ? ORDER BY name",
+            (host_id,),
+        )
+        return [(_row_to_tunnel(r), r[13]) for r in cur]
 
 
 def get_tunnel(tunnel_id: int) -> Optional[Tunnel]:
-    conn = _connect()
-    try:
-        cur = conn.execute("SELECT * FROM tunnels WHERE id = ?", (tunnel_id,))
+    with _lock:
+        conn = _connect()
+        cur = conn.execute(f"SELECT {_TUNNEL_COLUMNS} FROM tunnels WHERE id = ?", (tunnel_id,))
         row = cur.fetchone()
         return _row_to_tunnel(row) if row else None
-    finally:
-        conn.close()
 
 
-def _row_to_tunnel(row: sqlite3.Row) -> Tunnel:
+def _row_to_tunnel(row: tuple) -> Tunnel:
     return Tunnel(
-        id=row["id"],
-        host_id=row["host_id"],
-        name=row["name"],
-        type=row["type"],
-        local_bind=row["local_bind"] or "",
-        local_port=row["local_port"] or 0,
-        remote_host=row["remote_host"] or "",
-        remote_port=row["remote_port"] or 0,
-        remote_bind=row["remote_bind"] or "",
-        socks_port=row["socks_port"] or 0,
-        open_terminal=bool(row["open_terminal"]),
-        created_at=row["created_at"],
-        updated_at=row["updated_at"],
+        id=row[0],
+        host_id=row[1],
+        name=row[2],
+        type=row[3],
+        local_bind=row[4] or "",
+        local_port=row[5] or 0,
+        remote_host=row[6] or "",
+        remote_port=row[7] or 0,
+        remote_bind=row[8] or "",
+        socks_port=row[9] or 0,
+        open_terminal=bool(row[10]),
+        created_at=row[11],
+        updated_at=row[12],
+    )
+
+
+_INSERT_TUNNEL_SQL = """INSERT INTO tunnels (host_id, name, type, local_bind, local_port, remote_host,
+    remote_port, remote_bind, socks_port, open_terminal, created_at, updated_at)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)"""
+
+
+def _tunnel_insert_params(t: Tunnel) -> tuple:
+    now = _now()
+    return (
+        t.host_id,
+        t.name,
+        t.type,
+        t.local_bind or None,
+        t.local_port,
+        t.remote_host or None,
+        t.remote_port,
+        t.remote_bind or None,
+        t.socks_port,
+        1 if t.open_terminal else 0,
+        now,
+        now,
     )
 
 
+def _do_insert_tunnel(conn: sqlite3.Connection, t: Tunnel) -> int:
+    return conn.execute(_INSERT_TUNNEL_SQL, _tunnel_insert_params(t)).lastrowid
+
+
 def insert_tunnel(t: Tunnel) -> int:
-    conn = _connect()
-    try:
-        cur = conn.execute(
-            """INSERT INTO tunnels (host_id, name, type, local_bind, local_port, remote_host,
-               remote_port, remote_bind, socks_port, open_terminal, created_at, updated_at)
-               VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
-            (
-                t.host_id,
-                t.name,
-                t.type,
-                t.local_bind or None,
-                t.local_port,
-                t.remote_host or None,
-                t.remote_port,
-                t.remote_bind or None,
-                t.socks_port,
-                1 if t.open_terminal else 0,
-                _now(),
-                _now(),
-            ),
-        )
-        conn.commit()
-        return cur.lastrowid
-    finally:
-        conn.close()
+    return _submit(_do_insert_tunnel, t).result()
+
+
+def _do_insert_tunnels_bulk(conn: sqlite3.Connection, ts: list[Tunnel]) -> None:
+    conn.executemany(_INSERT_TUNNEL_SQL, [_tunnel_insert_params(t) for t in ts])
+
+
+def insert_tunnels_bulk(ts: list[Tunnel]) -> None:
+    """Insert many tunnels in one transaction (one commit instead of one per row)."""
+    _submit(_do_insert_tunnels_bulk, ts).result()
+
+
+def _do_update_tunnel(conn: sqlite3.Connection, t: Tunnel) -> None:
+    conn.execute(
+        """UPDATE tunnels SET name=?, type=?, local_bind=?, local_port=?, remote_host=?,
+           remote_port=?, remote_bind=?, socks_port=?, open_terminal=?, updated_at=?
+           WHERE id=?""",
+        (
+            t.name,
+            t.type,
+            t.local_bind or None,
+            t.local_port,
+            t.remote_host or None,
+            t.remote_port,
+            t.remote_bind or None,
+            t.socks_port,
+            1 if t.open_terminal else 0,
+            _now(),
+            t.id,
+        ),
+    )
 
 
 def update_tunnel(t: Tunnel) -> None:
     if t.id is None:
         raise ValueError("Tunnel must have id to update")
-    conn = _connect()
-    try:
-        conn.execute(
-            """UPDATE tunnels SET name=?, type=?, local_bind=?, local_port=?, remote_host=?,
-               remote_port=?, remote_bind=?, socks_port=?, open_terminal=?, updated_at=?
-               WHERE id=?""",
-            (
-                t.name,
-                t.type,
-                t.local_bind or None,
-                t.local_port,
-                t.remote_host or None,
-                t.remote_port,
-                t.remote_bind or None,
-                t.socks_port,
-                1 if t.open_terminal else 0,
-                _now(),
-                t.id,
-            ),
-        )
-        conn.commit()
-    finally:
-        conn.close()
+    _submit(_do_update_tunnel, t).result()
+
+
+def _do_delete_tunnel(conn: sqlite3.Connection, tunnel_id: int) -> None:
+    conn.execute("DELETE FROM tunnels WHERE id = ?", (tunnel_id,))
 
 
 def delete_tunnel(tunnel_id: int) -> None:
-    conn = _connect()
-    try:
-        conn.execute("DELETE FROM tunnels WHERE id = ?", (tunnel_id,))
-        conn.commit()
-    finally:
-        conn.close()
+    _submit(_do_delete_tunnel, tunnel_id).result()
 
 
 # --- Runs ---
 
+def _do_insert_run(conn: sqlite3.Connection, r: Run) -> int:
+    cur = conn.execute(
+        """INSERT INTO runs (tunnel_id, started_at, stopped_at, pid, mode, exit_code, log_path, last_error)
+           VALUES (?, ?, ?, ?, ?, ?, ?, ?)""",
+        (
+            r.tunnel_id,
+            r.started_at,
+            r.stopped_at,
+            r.pid,
+            r.mode,
+            r.exit_code,
+            r.log_path,
+            r.last_error,
+        ),
+    )
+    return cur.lastrowid
+
+
+def submit_run(r: Run) -> Future:
+    """Queue the insert; the returned future resolves to the new run id once committed."""
+    return _submit_unwaited(_do_insert_run, r)
+
+
 def insert_run(r: Run) -> int:
-    conn = _connect()
-    try:
-        cur = conn.execute(
-            """INSERT INTO runs (tunnel_id, started_at, stopped_at, pid, mode, exit_code, log_path, last_error)
-               VALUES (?, ?, ?, ?, ?, ?, ?, ?)""",
-            (
-                r.tunnel_id,
-                r.started_at,
-                r.stopped_at,
-                r.pid,
-                r.mode,
-                r.exit_code,
-                r.log_path,
-                r.last_error,
-            ),
-        )
-        conn.commit()
-        return cur.lastrowid
-    finally:
-        conn.close()
+    return _submit(_do_insert_run, r).result()
 
 
-def update_run_stopped(run_id: int, stopped_at: str, exit_code: Optional[int]) -> None:
-    conn = _connect()
-    try:
-        conn.execute(
-            "UPDATE runs SET stopped_at=?, exit_code=? WHERE id=?",
-            (stopped_at, exit_code, run_id),
-        )
-        conn.commit()
-    finally:
-        conn.close()
+def _do_insert_runs(conn: sqlite3.Connection, runs: list[Run]) -> list[int]:
+    return [_do_insert_run(conn, r) for r in runs]
+
+
+def insert_runs(runs: list[Run]) -> list[int]:
+    """Insert several runs in one write; returns their ids in order."""
+    return _submit(_do_insert_runs, runs).result()
+
+
+def _do_update_run_stopped(conn: sqlite3.Connection, run_id: int, stopped_at: int, exit_code: Optional[int]) -> None:
+    conn.execute(
+        "UPDATE runs SET stopped_at=?, exit_code=? WHERE id=?",
+        (stopped_at, exit_code, run_id),
+    )
+
+
+def update_run_stopped(run_id: int, stopped_at: int, exit_code: Optional[int]) -> None:
+    """Queue the update; returns without waiting for the commit."""
+    _submit_unwaited(_do_update_run_stopped, run_id, stopped_at, exit_code)
+
+
+def _do_update_latest_run_stopped(
+    conn: sqlite3.Connection, tunnel_id: int, stopped_at: int, exit_code: Optional[int]
+) -> None:
+    conn.execute(
+        "UPDATE runs SET stopped_at=?, exit_code=? WHERE id = (SELECT id FROM runs WHERE tunnel_id = ?"
+        " ORDER BY started_at DESC, id DESC LIMIT 1)",
+        (stopped_at, exit_code, tunnel_id),
+    )
+
+
+def update_latest_run_stopped(tunnel_id: int, stopped_at: int, exit_code: Optional[int]) -> None:
+    """Mark the tunnel's latest run stopped. Queued; returns without reading or waiting."""
+    _submit_unwaited(_do_update_latest_run_stopped, tunnel_id, stopped_at, exit_code)
+
+
+def _do_update_run_log_path(conn: sqlite3.Connection, run_id: int, log_path: str) -> None:
+    conn.execute("UPDATE runs SET log_path=? WHERE id=?", (log_path, run_id))
 
 
 def update_run_log_path(run_id: int, log_path: str) -> None:
-    conn = _connect()
-    try:
-        conn.execute("UPDATE runs SET log_path=? WHERE id=?", (log_path, run_id))
-        conn.commit()
-    finally:
-        conn.close()
+    """Queue the update; returns without waiting for the commit."""
+    _submit_unwaited(_do_update_run_log_path, run_id, log_path)
 
 
 def get_latest_run(tunnel_id: int) -> Optional[Run]:
-    conn = _connect()
-    try:
+    with _lock:
+        conn = _connect()
         cur = conn.execute(
-            "SELECT * FROM runs WHERE tunnel_id = ? ORDER BY started_at DESC LIMIT 1",
+            "SELECT id, tunnel_id, started_at, stopped_at, pid, mode, exit_code, log_path, last_error"
+            " FROM runs WHERE tunnel_id = ? ORDER BY started_at DESC, id DESC LIMIT 1",
             (tunnel_id,),
         )
         row = cur.fetchone()
-        if not row:
-            return None
-        return Run(
-            id=row["id"],
-            tunnel_id=row["tunnel_id"],
-            started_at=row["started_at"],
-            stopped_at=row["stopped_at"],
-            pid=row["pid"],
-            mode=row["mode"],
-            exit_code=row["exit_code"],
-            log_path=row["log_path"],
-            last_error=row["last_error"],
+        # Column list above is in Run field order.
+        return Run(*row) if row else None
+
+
+def list_open_detached_runs() -> list[Run]:
+    """Detached runs never marked stopped that are still their tunnel's latest run."""
+    with _lock:
+        conn = _connect()
+        cur = conn.execute(
+            "SELECT id, tunnel_id, started_at, stopped_at, pid, mode, exit_code, log_path, last_error"
+            " FROM runs r WHERE mode = 'detached' AND stopped_at IS NULL AND pid IS NOT NULL"
+            " AND id = (SELECT id FROM runs WHERE tunnel_id = r.tunnel_id ORDER BY started_at DESC, id DESC LIMIT 1)"
         )
-    finally:
-        conn.close()
+        return [Run(*row) for row in cur]
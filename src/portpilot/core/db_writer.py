@@ -0,0 +1,120 @@
+"""Background SQLite writer: a single thread that owns the write connection."""
+
+import queue
+import sqlite3
+import threading
+from concurrent.futures import Future
+from typing import Any, Callable
+
+# Queued once to make the writer finish its current batch and exit
+_STOP = object()
+
+
+class DbWriter(threading.Thread):
+    """Runs queued write callables on its own connection.
+
+    Each callable is invoked as fn(conn, *args). Everything queued while the
+    writer was busy is coalesced into one transaction, so a burst of writes
+    costs a single commit. Every write runs in its own savepoint: a failing
+    write is rolled back alone and its exception is set on its future.
+    Futures complete only after the commit, so a caller that waits on one
+    can read the row back from another connection. Once the thread has
+    exited, submit raises and anything still queued fails instead of hanging.
+    """
+
+    def __init__(self, connect: Callable[[], sqlite3.Connection]):
+        super().__init__(name="PortPilotDbWriter", daemon=True)
+        # Opened here so connection errors reach the caller; used only by this thread.
+        self._conn = connect()
+        self._conn.isolation_level = None  # explicit BEGIN/COMMIT below
+        self._queue: queue.Queue = queue.Queue()
+        # Guards _closed against puts, so nothing is queued after the final drain
+        self._state_lock = threading.Lock()
+        self._closed = False
+
+    def submit(self, fn: Callable[..., Any], *args: Any) -> Future:
+        """Queue fn(conn, *args) and return a future for its result."""
+        fut: Future = Future()
+        with self._state_lock:
+            if self._closed:
+                raise RuntimeError("database writer is not running")
+            self._queue.put((fn, args, fut))
+        return fut
+
+    def wait_idle(self) -> None:
+        """Block until every write submitted so far is committed (or failed)."""
+        self._queue.join()
+
+    def stop(self, timeout: float = 5.0) -> None:
+        """Commit pending writes, close the connection and end the thread."""
+        with self._state_lock:
+            if not self._closed:
+                self._queue.put(_STOP)
+        self.join(timeout)
+
+    def run(self) -> None:
+        conn = self._conn
+        try:
+            while True:
+                batch = [self._queue.get()]
+                while True:
+                    try:
+                        batch.append(self._queue.get_nowait())
+                    except queue.Empty:
+                        break
+                writes = [item for item in batch if item is not _STOP]
+                try:
+                    self._run_batch(conn, writes)
+                except Exception as e:
+                    try:
+                        if conn.in_transaction:
+                            conn.execute("ROLLBACK")
+                    except sqlite3.Error:
+                        pass  # retried before the next batch; the futures get the original error
+                    for _, _, fut in writes:
+                        if not fut.done():
+                            fut.set_exception(e)
+                finally:
+                    for _ in batch:
+                        self._queue.task_done()
+                if len(writes) != len(batch):
+                    return
+        finally:
+            self._close()
+
+    def _close(self) -> None:
+        """Refuse new writes and fail whatever is still queued, so no waiter blocks forever."""
+        with self._state_lock:
+            self._closed = True
+        err = RuntimeError("database writer is not running")
+        while True:
+            try:
+                item = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if item is not _STOP:
+                item[2].set_exception(err)
+            self._queue.task_done()
+        self._conn.close()
+
+    def _run_batch(self, conn: sqlite3.Connection, writes: list) -> None:
+        if not writes:
+            return
+        done: list[tuple[Future, Any]] = []
+        if conn.in_transaction:
+            conn.execute("ROLLBACK")  # left open by a batch whose rollback failed
+        conn.execute("BEGIN")
+        for fn, args, fut in writes:
+            conn.execute("SAVEPOINT write")
+            try:
+                result = fn(conn, *args)
+            except Exception as e:
+                conn.execute("ROLLBACK TO write")
+                conn.execute("RELEASE write")
+                fut.set_exception(e)
+            else:
+                conn.execute("RELEASE write")
+                done.append((fut, result))
+        conn.execute("COMMIT")
+        for fut, result in done:
+            fut.set_result(result)
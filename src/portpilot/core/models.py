@@ -1,11 +1,10 @@
 """Data models for PortPilot."""
 
 from dataclasses import dataclass
-from datetime import datetime
 from typing import Optional
 
 
-@dataclass
+@dataclass(slots=True)
 class Host:
     """SSH host configuration."""
     id: Optional[int]
@@ -17,8 +16,8 @@ class Host:
     extra_args: str
     keepalive_interval: int
     keepalive_countmax: int
-    created_at: Optional[str]
-    updated_at: Optional[str]
+    created_at: Optional[int]  # Unix epoch seconds
+    updated_at: Optional[int]
 
     @classmethod
     def default(cls) -> "Host":
@@ -37,7 +36,7 @@ class Host:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class Tunnel:
     """Tunnel configuration."""
     id: Optional[int]
@@ -51,8 +50,8 @@ class Tunnel:
     remote_bind: str
     socks_port: int
     open_terminal: bool
-    created_at: Optional[str]
-    updated_at: Optional[str]
+    created_at: Optional[int]  # Unix epoch seconds
+    updated_at: Optional[int]
 
     @classmethod
     def default_local(cls, host_id: int) -> "Tunnel":
@@ -109,13 +108,13 @@ class Tunnel:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class Run:
     """Tunnel run record."""
     id: Optional[int]
     tunnel_id: int
-    started_at: str
-    stopped_at: Optional[str]
+    started_at: int  # Unix epoch seconds
+    stopped_at: Optional[int]
     pid: Optional[int]
     mode: str  # "managed" | "detached"
     exit_code: Optional[int]
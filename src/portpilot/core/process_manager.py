@@ -3,22 +3,56 @@
 import os
 import subprocess
 import sys
-import tempfile
-from datetime import datetime
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
 from typing import Optional
 
 from PySide6.QtCore import QObject, QProcess, QProcessEnvironment, Signal
 
 from .models import Host, Run, Tunnel
-from .settings import get_logs_dir, get_ssh_askpass_bat
+from .settings import SSH_ASKPASS_PASSWORD_ENV, get_logs_dir, get_ssh_askpass_bat
 from .ssh_builder import build_full_command, find_ssh
 
 
+# Working directory for detached tunnels
+_HOME = os.path.expanduser("~")
+
+# DetachedLauncher spawns on this pool, keeping log-file creation and Popen off the GUI thread
+_LAUNCH_EXEC = ThreadPoolExecutor(max_workers=4, thread_name_prefix="launch")
+
+# A stopping ssh gets this long to exit after terminate() before it is killed (ms)
+STOP_GRACE_MS = 3000
+
+# is_process_alive results are reused for this long (s), so a status tick
+# and the table reload it triggers probe each PID once
+ALIVE_CACHE_SECONDS = 1.0
+_alive_cache: dict[int, tuple[float, bool]] = {}
+
 # Windows creation flags for detached process
 if sys.platform == "win32":
+    import ctypes
+    from ctypes import wintypes
+
     DETACHED_PROCESS = 0x00000008
     CREATE_NEW_PROCESS_GROUP = 0x00000200
+
+    _PROCESS_QUERY_LIMITED_INFORMATION = 0x1000
+    _STILL_ACTIVE = 259
+    _kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)
+    _kernel32.OpenProcess.argtypes = (wintypes.DWORD, wintypes.BOOL, wintypes.DWORD)
+    _kernel32.OpenProcess.restype = wintypes.HANDLE
+    _kernel32.GetExitCodeProcess.argtypes = (wintypes.HANDLE, ctypes.POINTER(wintypes.DWORD))
+    _kernel32.GetExitCodeProcess.restype = wintypes.BOOL
+    _kernel32.CloseHandle.argtypes = (wintypes.HANDLE,)
+    _kernel32.CloseHandle.restype = wintypes.BOOL
+    _kernel32.QueryFullProcessImageNameW.argtypes = (
+        wintypes.HANDLE,
+        wintypes.DWORD,
+        wintypes.LPWSTR,
+        ctypes.POINTER(wintypes.DWORD),
+    )
+    _kernel32.QueryFullProcessImageNameW.restype = wintypes.BOOL
 else:
     DETACHED_PROCESS = 0
     CREATE_NEW_PROCESS_GROUP = 0
@@ -27,37 +61,15 @@ else:
 def _log_path_for_tunnel(tunnel_id: int) -> Path:
     """Generate unique log file path for a tunnel run."""
     logs_dir = get_logs_dir()
-    ts = datetime.now().strftime("%Y%m%d_%H%M%S")
+    ts = time.strftime("%Y%m%d_%H%M%S")
     return logs_dir / f"tunnel_{tunnel_id}_{ts}.log"
 
 
-def _now_iso() -> str:
-    return datetime.utcnow().isoformat() + "Z"
-
-
-def _write_password_for_askpass(password: str) -> Optional[Path]:
-    """Write password to the file SSH_ASKPASS helper reads. Returns path or None."""
-    try:
-        path = Path(tempfile.gettempdir()) / "portpilot_ssh_pass.txt"
-        path.write_text(password, encoding="utf-8")
-        return path
-    except Exception:
-        return None
-
-
-def _delete_password_file() -> None:
-    """Remove the password file used by SSH_ASKPASS."""
-    try:
-        path = Path(tempfile.gettempdir()) / "portpilot_ssh_pass.txt"
-        path.unlink(missing_ok=True)
-    except OSError:
-        pass
-
-
 class ManagedTunnelProcess(QObject):
     """QProcess-based tunnel with log streaming."""
 
-    log_line = Signal(str)
+    log_lines = Signal(list)  # list[str], one emission per read burst
+    started_signal = Signal(int)  # tunnel_id - emitted once ssh is actually running
     finished_signal = Signal(int, int, int)  # tunnel_id, exit_code, run_id
 
     def __init__(
@@ -76,66 +88,82 @@ class ManagedTunnelProcess(QObject):
         self.process: Optional[QProcess] = None
         self.log_path: Optional[Path] = None
         self.log_file = None
-        self._pass_file: Optional[Path] = None
 
     def start(self, password: Optional[str] = None) -> bool:
+        """Launch ssh without waiting for it; the outcome arrives as started_signal or finished_signal."""
         try:
             cmd = build_full_command(self.host, self.tunnel)
         except FileNotFoundError as e:
-            self.log_line.emit(f"Error: {e}")
+            self.log_lines.emit([f"Error: {e}"])
             return False
 
         self.log_path = _log_path_for_tunnel(self.tunnel_id)
         try:
-            self.log_file = open(self.log_path, "w", encoding="utf-8")
+            # Binary: ssh output goes to disk as-is, without a decode/encode round trip
+            self.log_file = open(self.log_path, "wb")
         except OSError as e:
-            self.log_line.emit(f"Failed to open log file: {e}")
+            self.log_lines.emit([f"Failed to open log file: {e}"])
             return False
 
         self.process = QProcess(self)
-        self.process.readyReadStandardOutput.connect(self._on_stdout)
-        self.process.readyReadStandardError.connect(self._on_stderr)
+        self.process.readyReadStandardOutput.connect(lambda: self._drain(False))
+        self.process.readyReadStandardError.connect(lambda: self._drain(True))
+        self.process.started.connect(self._on_started)
+        self.process.errorOccurred.connect(self._on_error)
         self.process.finished.connect(self._on_finished)
 
         if password:
-            self._pass_file = _write_password_for_askpass(password)
-            if self._pass_file:
-                env = QProcessEnvironment.systemEnvironment()
-                env.insert("SSH_ASKPASS", str(get_ssh_askpass_bat().resolve()))
-                env.insert("DISPLAY", ":0")
-                self.process.setProcessEnvironment(env)
+            env = QProcessEnvironment.systemEnvironment()
+            env.insert("SSH_ASKPASS", str(get_ssh_askpass_bat().resolve()))
+            env.insert("DISPLAY", ":0")
+            env.insert(SSH_ASKPASS_PASSWORD_ENV, password)
+            self.process.setProcessEnvironment(env)
 
         self.process.start(cmd[0], cmd[1:])
-        if not self.process.waitForStarted(5000):
-            err = self.process.errorString()
-            self._emit(f"Failed to start: {err}")
-            self.log_file.close()
-            self.log_file = None
-            return False
+        return True
 
+    def _on_started(self) -> None:
         self._emit(f"Started PID {self.process.processId()}")
-        return True
+        self.started_signal.emit(self.tunnel_id)
+
+    def _on_error(self, error: QProcess.ProcessError) -> None:
+        # Other errors are followed by finished; a failed launch is not
+        if error == QProcess.ProcessError.FailedToStart:
+            self._emit(f"Failed to start: {self.process.errorString()}")
+            self._on_finished(1, QProcess.ExitStatus.CrashExit)
 
     def _emit(self, line: str) -> None:
-        self.log_line.emit(line)
+        self.log_lines.emit([line])
+        self._write_log((line + "\n").encode("utf-8"))
+        self._flush_log()
+
+    def _write_log(self, data: bytes) -> None:
         if self.log_file:
             try:
-                self.log_file.write(line + "\n")
-                self.log_file.flush()
+                self.log_file.write(data)
             except OSError:
                 pass
 
-    def _on_stdout(self) -> None:
-        data = self.process.readAllStandardOutput().data().decode("utf-8", errors="replace")
-        for line in data.splitlines():
-            if line.strip():
-                self._emit(line)
+    def _flush_log(self) -> None:
+        if self.log_file:
+            try:
+                self.log_file.flush()
+            except OSError:
+                pass
 
-    def _on_stderr(self) -> None:
-        data = self.process.readAllStandardError().data().decode("utf-8", errors="replace")
-        for line in data.splitlines():
-            if line.strip():
-                self._emit(line)
+    def _drain(self, is_err: bool) -> None:
+        """Write a burst of ssh output to the log and emit its non-empty lines once."""
+        if is_err:
+            data = self.process.readAllStandardError().data()
+        else:
+            data = self.process.readAllStandardOutput().data()
+        self._write_log(data)
+        # Once per burst, so the file is current whenever the viewer reloads it
+        self._flush_log()
+        # Split and filter on bytes; only the lines that are shown get decoded
+        lines = [line.decode("utf-8", errors="replace") for line in data.splitlines() if line.strip()]
+        if lines:
+            self.log_lines.emit(lines)
 
     def _on_finished(self, code: int, status: int) -> None:
         if self.log_file:
@@ -144,19 +172,10 @@ class ManagedTunnelProcess(QObject):
             except OSError:
                 pass
             self.log_file = None
-        if self._pass_file and self._pass_file.exists():
-            try:
-                self._pass_file.unlink(missing_ok=True)
-            except OSError:
-                pass
         self.finished_signal.emit(self.tunnel_id, code, self.run_id)
 
     def stop(self) -> None:
-        if self.process and self.process.state() != QProcess.NotRunning:
-            self.process.terminate()
-            if not self.process.waitForFinished(3000):
-                self.process.kill()
-                self.process.waitForFinished(1000)
+        stop_managed([self])
 
     def pid(self) -> Optional[int]:
         if self.process:
@@ -167,6 +186,21 @@ class ManagedTunnelProcess(QObject):
         return self.process is not None and self.process.state() != QProcess.NotRunning
 
 
+def stop_managed(procs: list[ManagedTunnelProcess]) -> None:
+    """Stop several managed tunnels, sharing one grace period instead of waiting it out per process."""
+    running = [p for p in procs if p.is_running()]
+    for p in running:
+        p.process.terminate()
+    deadline = time.monotonic() + STOP_GRACE_MS / 1000
+    for p in running:
+        p.process.waitForFinished(max(0, int((deadline - time.monotonic()) * 1000)))
+    running = [p for p in running if p.is_running()]
+    for p in running:
+        p.process.kill()
+    for p in running:
+        p.process.waitForFinished(1000)
+
+
 def start_detached(
     tunnel_id: int,
     host: Host,
@@ -191,12 +225,15 @@ def start_detached(
     if sys.platform == "win32":
         flags = DETACHED_PROCESS | CREATE_NEW_PROCESS_GROUP
 
+    # Inherit the parent environment (env=None) unless askpass needs extra variables
     env = None
     if password:
-        _write_password_for_askpass(password)
-        env = os.environ.copy()
-        env["SSH_ASKPASS"] = str(get_ssh_askpass_bat().resolve())
-        env["DISPLAY"] = ":0"
+        env = {
+            **os.environ,
+            "SSH_ASKPASS": str(get_ssh_askpass_bat().resolve()),
+            "DISPLAY": ":0",
+            SSH_ASKPASS_PASSWORD_ENV: password,
+        }
 
     try:
         proc = subprocess.Popen(
@@ -205,7 +242,7 @@ def start_detached(
             stderr=subprocess.STDOUT,
             creationflags=flags,
             start_new_session=(sys.platform != "win32"),
-            cwd=os.path.expanduser("~"),
+            cwd=_HOME,
             env=env,
         )
         log_file.write(f"Started detached PID {proc.pid}\n")
@@ -221,8 +258,35 @@ def start_detached(
         return None, None, str(e)
 
 
+class DetachedLauncher(QObject):
+    """Runs start_detached on a worker thread; the result is delivered on the launcher's thread."""
+
+    launched = Signal(int, object)  # tunnel_id, start_detached's (pid, log_path, error)
+
+    def launch(self, tunnel_id: int, host: Host, tunnel: Tunnel, password: Optional[str] = None) -> Future:
+        """Start the launch; the returned future holds the same result launched carries."""
+        return _LAUNCH_EXEC.submit(self._run, tunnel_id, host, tunnel, password)
+
+    def _run(self, tunnel_id: int, host: Host, tunnel: Tunnel, password: Optional[str]) -> tuple:
+        result = start_detached(tunnel_id, host, tunnel, password)
+        self.launched.emit(tunnel_id, result)
+        return result
+
+
+def open_exit_fd(pid: int) -> Optional[int]:
+    """Open a pidfd that becomes readable when pid exits, or None where pidfds are unavailable."""
+    pidfd_open = getattr(os, "pidfd_open", None)  # Linux 5.3+
+    if pidfd_open is None:
+        return None
+    try:
+        return pidfd_open(pid)
+    except OSError:
+        return None
+
+
 def kill_process_tree(pid: int) -> bool:
     """Kill process and its children. On Windows uses taskkill /T /F."""
+    _alive_cache.pop(pid, None)
     if sys.platform == "win32":
         try:
             subprocess.run(
@@ -245,10 +309,89 @@ def kill_process_tree(pid: int) -> bool:
                 return False
 
 
-def is_process_alive(pid: int) -> bool:
-    """Check if process exists."""
+def kill_process_trees(pids: list[int]) -> list[bool]:
+    """kill_process_tree for several pids at once; the kills run in parallel."""
+    if len(pids) < 2:
+        return [kill_process_tree(pid) for pid in pids]
+    with ThreadPoolExecutor(max_workers=min(len(pids), 8), thread_name_prefix="kill") as ex:
+        return list(ex.map(kill_process_tree, pids))
+
+
+def _probe_process(pid: int) -> bool:
+    if sys.platform == "win32":
+        # os.kill(pid, 0) would send CTRL_C_EVENT on Windows; query the exit code instead
+        handle = _kernel32.OpenProcess(_PROCESS_QUERY_LIMITED_INFORMATION, False, pid)
+        if not handle:
+            return False
+        try:
+            code = wintypes.DWORD()
+            if not _kernel32.GetExitCodeProcess(handle, ctypes.byref(code)):
+                return False
+            return code.value == _STILL_ACTIVE
+        finally:
+            _kernel32.CloseHandle(handle)
     try:
         os.kill(pid, 0)
         return True
-    except (OSError, ProcessLookupError):
+    except PermissionError:
+        return True  # exists, owned by another user
+    except OSError:
         return False
+
+
+def is_process_alive(pid: int) -> bool:
+    """Check if process exists. Results are cached for ALIVE_CACHE_SECONDS."""
+    now = time.monotonic()
+    cached = _alive_cache.get(pid)
+    if cached and now - cached[0] < ALIVE_CACHE_SECONDS:
+        return cached[1]
+    alive = _probe_process(pid)
+    _alive_cache[pid] = (now, alive)
+    return alive
+
+
+def is_ssh_process(pid: int) -> bool:
+    """True if pid is a running ssh client, so a pid from an earlier session is not a reused one.
+
+    Where the executable name cannot be read (no /proc), only liveness is checked.
+    """
+    if sys.platform == "win32":
+        handle = _kernel32.OpenProcess(_PROCESS_QUERY_LIMITED_INFORMATION, False, pid)
+        if not handle:
+            return False
+        try:
+            buf = ctypes.create_unicode_buffer(32768)
+            size = wintypes.DWORD(len(buf))
+            if not _kernel32.QueryFullProcessImageNameW(handle, 0, buf, ctypes.byref(size)):
+                return False
+            return os.path.basename(buf.value).lower() == "ssh.exe"
+        finally:
+            _kernel32.CloseHandle(handle)
+    try:
+        with open(f"/proc/{pid}/comm", "rb") as f:
+            return f.read().strip() == b"ssh"
+    except FileNotFoundError:
+        return not os.path.isdir("/proc") and is_process_alive(pid)
+    except OSError:
+        return False
+
+
+def reap_if_exited(pid: int, block: bool = False) -> bool:
+    """True if pid has exited.
+
+    A detached tunnel started by this session is our child, so one waitid both
+    answers and reaps it; a zombie left unreaped still passes is_process_alive.
+    Pids from an earlier session fall back to the liveness probe.
+    block waits for our child to exit; only pass it for a pid just killed.
+    """
+    if hasattr(os, "waitid"):
+        try:
+            info = os.waitid(os.P_PID, pid, os.WEXITED | (0 if block else os.WNOHANG))
+        except ChildProcessError:
+            pass
+        else:
+            if info is None:
+                return False
+            _alive_cache.pop(pid, None)
+            return True
+    return not is_process_alive(pid)
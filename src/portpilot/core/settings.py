@@ -1,5 +1,6 @@
 """App paths and settings using appdirs."""
 
+import functools
 import os
 import sys
 from pathlib import Path
@@ -12,6 +13,7 @@ except ImportError:
     _appdirs_available = False
 
 
+@functools.lru_cache(maxsize=1)
 def _get_app_data_dir() -> Path:
     """Get %APPDATA%\\PortPilot on Windows."""
     if _appdirs_available:
@@ -40,6 +42,7 @@ def ensure_app_dirs() -> None:
     get_logs_dir()
 
 
+@functools.lru_cache(maxsize=1)
 def get_icon_path() -> Optional[Path]:
     """Path to app icon.ico. Works when running from source or PyInstaller bundle."""
     if getattr(sys, "frozen", False):
@@ -50,10 +53,27 @@ def get_icon_path() -> Optional[Path]:
     return icon if icon.exists() else None
 
 
+# Environment variable the SSH_ASKPASS helper reads the password from.
+# It is only ever set on the ssh child's environment, never written to disk.
+SSH_ASKPASS_PASSWORD_ENV = "PORTPILOT_SSH_PASS"
+
+# Delayed expansion echoes the value verbatim, including characters cmd treats as special.
+_ASKPASS_BAT = (
+    "@echo off\r\n"
+    "setlocal EnableDelayedExpansion\r\n"
+    f"echo(!{SSH_ASKPASS_PASSWORD_ENV}!\r\n"
+)
+
+
+@functools.lru_cache(maxsize=1)
 def get_ssh_askpass_bat() -> Path:
-    """Path to SSH_ASKPASS batch helper. Creates it if needed."""
+    """Path to SSH_ASKPASS batch helper. Creates or updates it if needed."""
     ensure_app_dirs()
     bat = _get_app_data_dir() / "ssh_askpass.bat"
-    if not bat.exists():
-        bat.write_text('@echo off\ntype "%TEMP%\\portpilot_ssh_pass.txt"\n', encoding="utf-8")
+    try:
+        current = bat.read_text(encoding="utf-8")
+    except OSError:
+        current = None
+    if current != _ASKPASS_BAT:
+        bat.write_text(_ASKPASS_BAT, encoding="utf-8", newline="")
     return bat
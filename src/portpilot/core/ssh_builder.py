@@ -1,5 +1,7 @@
 """SSH command builder for port forwarding. Handles Windows quoting safely."""
 
+import functools
+import os
 import shutil
 import subprocess
 from typing import Optional
@@ -9,29 +11,36 @@ from .models import Host, Tunnel
 
 SSH_EXE = "ssh.exe"
 
+# Common Windows OpenSSH locations
+_SSH_CANDIDATES = (
+    r"C:\Windows\System32\OpenSSH\ssh.exe",
+    r"C:\Program Files\OpenSSH\ssh.exe",
+)
 
+
+@functools.lru_cache(maxsize=1)
 def find_ssh() -> Optional[str]:
-    """Locate ssh.exe. Returns path or None if not found."""
-    path = shutil.which(SSH_EXE)
-    if path:
-        return path
-    # Common Windows OpenSSH locations
-    for loc in [
-        r"C:\Windows\System32\OpenSSH\ssh.exe",
-        r"C:\Program Files\OpenSSH\ssh.exe",
-    ]:
-        if shutil.os.path.isfile(loc):
+    """Locate ssh.exe. Returns path or None if not found. Cached after the first lookup."""
+    # The standard install paths are checked first: one stat instead of a PATH walk
+    for loc in _SSH_CANDIDATES:
+        if os.path.isfile(loc):
             return loc
-    return None
+    return shutil.which(SSH_EXE)
+
+
+_QUOTE_TABLE = str.maketrans({"\\": "\\\\", '"': '\\"'})
+_NEEDS_QUOTING = frozenset(' \t"\\')
 
 
 def _quote_arg(s: str) -> str:
     """Quote argument for Windows cmd/Process. Handles spaces and quotes."""
     if not s:
         return '""'
-    # Escape backslashes before closing quote, then wrap in quotes
-    s = s.replace("\\", "\\\\").replace('"', '\\"')
-    return f'"{s}"'
+    # Plain arguments (no whitespace, quotes or backslashes) pass through unquoted
+    if _NEEDS_QUOTING.isdisjoint(s):
+        return s
+    # Escape backslashes and quotes in one pass, then wrap in quotes
+    return f'"{s.translate(_QUOTE_TABLE)}"'
 
 
 def build_ssh_args(host: Host, tunnel: Tunnel) -> list[str]:
@@ -39,63 +48,44 @@ def build_ssh_args(host: Host, tunnel: Tunnel) -> list[str]:
     Build args for ssh.exe (excluding the executable).
     Uses -N, -o ExitOnForwardFailure=yes, and appropriate -L/-R/-D.
     """
-    args: list[str] = []
-
-    # No remote command
-    args.append("-N")
-
-    # Exit if port forward fails
-    args.append("-o")
-    args.append("ExitOnForwardFailure=yes")
+    # No remote command; exit if port forward fails
+    args = ["-N", "-o", "ExitOnForwardFailure=yes"]
 
     # Keepalive
     if host.keepalive_interval and host.keepalive_interval > 0:
-        args.append("-o")
-        args.append(f"ServerAliveInterval={host.keepalive_interval}")
+        args += ("-o", f"ServerAliveInterval={host.keepalive_interval}")
         if host.keepalive_countmax and host.keepalive_countmax > 0:
-            args.append("-o")
-            args.append(f"ServerAliveCountMax={host.keepalive_countmax}")
+            args += ("-o", f"ServerAliveCountMax={host.keepalive_countmax}")
 
     # Identity file
-    if host.identity_file and host.identity_file.strip():
-        args.append("-i")
-        args.append(host.identity_file.strip())
+    identity = host.identity_file.strip() if host.identity_file else ""
+    if identity:
+        args += ("-i", identity)
 
     # Port
-    args.append("-p")
-    args.append(str(host.port))
+    args += ("-p", str(host.port))
 
     # Tunnel type
     if tunnel.type == "local":
         # -L [bind_address:]port:host:hostport
         bind = tunnel.local_bind.strip() or "127.0.0.1"
         remote_host = tunnel.remote_host.strip() or "127.0.0.1"
-        spec = f"{bind}:{tunnel.local_port}:{remote_host}:{tunnel.remote_port}"
-        args.append("-L")
-        args.append(spec)
+        args += ("-L", f"{bind}:{tunnel.local_port}:{remote_host}:{tunnel.remote_port}")
     elif tunnel.type == "remote":
         # -R [bind_address:]port:host:hostport
         bind = tunnel.remote_bind.strip() or "0.0.0.0"
         local_host = tunnel.remote_host.strip() or "127.0.0.1"  # remote_host stores local_host for -R
-        spec = f"{bind}:{tunnel.remote_port}:{local_host}:{tunnel.local_port}"
-        args.append("-R")
-        args.append(spec)
+        args += ("-R", f"{bind}:{tunnel.remote_port}:{local_host}:{tunnel.local_port}")
     elif tunnel.type == "dynamic":
         # -D [bind_address:]port
         bind = tunnel.local_bind.strip() or "127.0.0.1"
-        spec = f"{bind}:{tunnel.socks_port}"
-        args.append("-D")
-        args.append(spec)
+        args += ("-D", f"{bind}:{tunnel.socks_port}")
     else:
         raise ValueError(f"Unknown tunnel type: {tunnel.type}")
 
-    # Extra args (split on whitespace, preserve quoted strings if needed)
-    if host.extra_args and host.extra_args.strip():
-        # Simple split - user must not use complex quoting in extra_args
-        for part in host.extra_args.split():
-            part = part.strip()
-            if part:
-                args.append(part)
+    # Extra args (simple whitespace split - user must not use complex quoting in extra_args)
+    if host.extra_args:
+        args.extend(host.extra_args.split())
 
     # User@host
     args.append(f"{host.username}@{host.hostname}")
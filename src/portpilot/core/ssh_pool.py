@@ -0,0 +1,114 @@
+"""Shared SSH transports: tunnels to the same host reuse one authenticated connection."""
+
+import hashlib
+import hmac
+import os
+import threading
+from typing import Any, Callable, Optional
+
+
+# (hostname, port, username, identity file, credential digest)
+PoolKey = tuple[str, int, str, str, str]
+
+# Per-process salt so the digest of a password is not a reusable hash of it
+_KEY_SALT = os.urandom(16)
+
+
+def make_pool_key(hostname: str, port: int, username: str, identity_file: str, secret: str) -> PoolKey:
+    """Key for a pooled transport. The credentials are part of it, so a tunnel
+    only shares a connection that was authenticated with the same ones."""
+    digest = hmac.new(_KEY_SALT, (secret or "").encode("utf-8"), hashlib.sha256).hexdigest()
+    return (hostname, port, username, identity_file, digest)
+
+
+class _PoolEntry:
+    __slots__ = ("lock", "transport", "refs", "watchers")
+
+    def __init__(self):
+        # Held while connecting so concurrent starts to one host wait and reuse
+        self.lock = threading.Lock()
+        self.transport: Any = None
+        self.refs = 0
+        # (transport, on_closed) pairs; a callback only fires for the transport it subscribed to
+        self.watchers: list[tuple[Any, Callable[[], None]]] = []
+
+
+class SSHConnectionPool:
+    """Refcounted paramiko Transports keyed by host; the last release closes it.
+
+    Each pooled transport gets one watcher thread that blocks on the transport
+    thread and calls the holders' on_closed callbacks when the connection drops.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._entries: dict[PoolKey, _PoolEntry] = {}
+
+    def acquire(
+        self,
+        key: PoolKey,
+        connect: Callable[[], Any],
+        on_closed: Optional[Callable[[], None]] = None,
+    ) -> Optional[Any]:
+        """Return the live transport for key, calling connect() to open one if needed.
+
+        on_closed is called from a watcher thread if the transport goes down
+        while still held. Returns None (and takes no reference) if connect()
+        did not produce an active transport; if connect() raises, the
+        reference is dropped and the exception propagates.
+        """
+        with self._lock:
+            entry = self._entries.setdefault(key, _PoolEntry())
+            entry.refs += 1  # keeps the entry alive while we connect
+        try:
+            with entry.lock:
+                if entry.transport is None or not entry.transport.is_active():
+                    transport = connect()
+                    entry.transport = transport
+                    if transport is not None and transport.is_active():
+                        threading.Thread(
+                            target=self._watch, args=(entry, transport), name="ssh-watch", daemon=True
+                        ).start()
+                transport = entry.transport
+        except BaseException:
+            self._release(key, entry, None)
+            raise
+        if transport is None or not transport.is_active():
+            self._release(key, entry, None)
+            return None
+        if on_closed is not None:
+            with self._lock:
+                entry.watchers.append((transport, on_closed))
+        return transport
+
+    def release(self, key: PoolKey, on_closed: Optional[Callable[[], None]] = None) -> None:
+        """Drop one reference to key's transport, closing it when unused."""
+        with self._lock:
+            entry = self._entries.get(key)
+        if entry is not None:
+            self._release(key, entry, on_closed)
+
+    def _release(self, key: PoolKey, entry: _PoolEntry, on_closed: Optional[Callable[[], None]]) -> None:
+        with self._lock:
+            if on_closed is not None:
+                entry.watchers = [w for w in entry.watchers if w[1] != on_closed]
+            entry.refs -= 1
+            if entry.refs > 0:
+                return
+            if self._entries.get(key) is entry:
+                del self._entries[key]
+            transport, entry.transport = entry.transport, None
+        if transport is not None:
+            transport.close()
+
+    def _watch(self, entry: _PoolEntry, transport: Any) -> None:
+        transport.join()  # paramiko's Transport is a thread that exits when the connection ends
+        with self._lock:
+            callbacks = [cb for t, cb in entry.watchers if t is transport]
+            entry.watchers = [w for w in entry.watchers if w[0] is not transport]
+        for cb in callbacks:
+            cb()
+
+
+# Process-wide pool used by SSHTunnelRunner
+ssh_pool = SSHConnectionPool()
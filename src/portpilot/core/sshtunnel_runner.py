@@ -1,17 +1,105 @@
 """SSH tunnel via sshtunnel library - supports password auth for Local (-L) tunnels."""
 
 import threading
-from typing import Optional
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Optional
 
-from PySide6.QtCore import QObject, Signal
+from PySide6.QtCore import QObject, QTimer, Signal
 
 from .models import Host, Tunnel
+from .ssh_pool import PoolKey, make_pool_key, ssh_pool
+
+try:
+    from sshtunnel import SSHTunnelForwarder
+except ImportError:
+    SSHTunnelForwarder = None
+else:
+    # _PooledForwarder overrides these sshtunnel internals (written against 0.4.x-0.5.x)
+    _FORWARDER_INTERNALS = ("_connect_to_gateway", "_stop_transport")
+    _missing = [name for name in _FORWARDER_INTERNALS if not hasattr(SSHTunnelForwarder, name)]
+    if _missing:
+        raise ImportError(
+            f"Unsupported sshtunnel version: SSHTunnelForwarder lacks {', '.join(_missing)}; "
+            "install sshtunnel>=0.4.0,<0.6"
+        )
+
+    class _PooledForwarder(SSHTunnelForwarder):
+        """SSHTunnelForwarder that borrows its transport from ssh_pool instead of owning one."""
+
+        def __init__(self, pool_key: PoolKey, on_closed: Callable[[], None], **kwargs):
+            self._pool_key = pool_key
+            self._on_closed = on_closed
+            self._pooled = False
+            super().__init__(**kwargs)
+            if not hasattr(self, "_server_list"):
+                raise RuntimeError("Unsupported sshtunnel version: SSHTunnelForwarder has no _server_list")
+
+        def start(self):
+            try:
+                super().start()
+            except Exception:
+                if not self.is_active:
+                    # Listeners get bound before the connect fails and are never served;
+                    # close them here, since shutdown() would wait on them forever
+                    for srv in self._server_list:
+                        srv.server_close()
+                    self._server_list = []
+                raise
+
+        def _open_transport(self):
+            super()._connect_to_gateway()
+            return self.__dict__.get("_transport")
+
+        def _connect_to_gateway(self):
+            transport = ssh_pool.acquire(self._pool_key, self._open_transport, self._on_closed)
+            if transport is not None:
+                self._transport = transport
+                self._pooled = True
+
+        def _stop_transport(self, force=False):
+            if not self._pooled:
+                super()._stop_transport(force=force)
+                return
+            # Hide the shared transport so the base class only shuts down our listeners
+            self.__dict__.pop("_transport", None)
+            self._pooled = False
+            super()._stop_transport(force=False)
+            ssh_pool.release(self._pool_key, self._on_closed)
+
+
+# Tunnel setup and teardown run on this shared pool; a running tunnel holds no worker
+_TUNNEL_EXEC = ThreadPoolExecutor(max_workers=8, thread_name_prefix="tunnel")
+
+# Worker-thread log lines are queued and delivered in one batch per interval (ms)
+LOG_DRAIN_INTERVAL_MS = 100
+
+
+class _RunnerState:
+    """Per-run state shared between the runner and pool workers."""
+
+    __slots__ = ("server", "future", "stop_event", "finish_lock", "finished", "log_queue")
+
+    def __init__(self):
+        self.server = None
+        self.future: Optional[Future] = None
+        self.stop_event = threading.Event()
+        self.finish_lock = threading.Lock()
+        self.finished = False
+        # deque append/popleft are atomic, so workers can queue without a lock
+        self.log_queue: deque[str] = deque()
 
 
 class SSHTunnelRunner(QObject):
-    """Runs sshtunnel for Local (-L) with password auth. Runs in a thread."""
+    """Runs sshtunnel for Local (-L) with password auth.
 
-    log_line = Signal(str)
+    Connecting and shutting down happen on a shared worker pool. Tunnels to
+    the same host/port/user with the same credentials share one SSH
+    connection via ssh_pool, which reports a dropped connection through
+    _on_transport_closed.
+    """
+
+    log_lines = Signal(list)  # batch of log lines, delivered on the runner's thread
     started_signal = Signal(int)  # tunnel_id - emitted when tunnel is actually running
     finished_signal = Signal(int, int)  # tunnel_id, exit_code (0=stopped, 1=error)
 
@@ -26,18 +114,18 @@ class SSHTunnelRunner(QObject):
         self.tunnel_id = tunnel_id
         self.host = host
         self.tunnel = tunnel
-        self._server = None
-        self._thread: Optional[threading.Thread] = None
-        self._stop_requested = False
+        self._s = _RunnerState()
+        self._log_timer = QTimer(self)
+        self._log_timer.setInterval(LOG_DRAIN_INTERVAL_MS)
+        self._log_timer.timeout.connect(self._drain_log)
+        self.finished_signal.connect(self._on_finished)
 
     def start(self, password: str) -> bool:
         if self.tunnel.type != "local":
-            self.log_line.emit("sshtunnel only supports Local (-L) tunnels")
+            self.log_lines.emit(["sshtunnel only supports Local (-L) tunnels"])
             return False
-        try:
-            from sshtunnel import SSHTunnelForwarder
-        except ImportError:
-            self.log_line.emit("Error: sshtunnel not installed. Run: pip install sshtunnel")
+        if SSHTunnelForwarder is None:
+            self.log_lines.emit(["Error: sshtunnel not installed. Run: pip install sshtunnel"])
             return False
 
         local_bind = (self.tunnel.local_bind.strip() or "127.0.0.1", self.tunnel.local_port)
@@ -57,38 +145,72 @@ class SSHTunnelRunner(QObject):
         if self.host.keepalive_interval and self.host.keepalive_interval > 0:
             ssh_kwargs["set_keepalive"] = self.host.keepalive_interval
 
-        def run_tunnel():
-            try:
-                self._server = SSHTunnelForwarder(**ssh_kwargs)
-                self._server.start()
-                self.log_line.emit(f"Tunnel started: {local_bind[0]}:{local_bind[1]} -> {remote_bind[0]}:{remote_bind[1]}")
-                self.started_signal.emit(self.tunnel_id)
-                while not self._stop_requested and self._server.is_active:
-                    import time
-                    time.sleep(0.5)
-            except Exception as e:
-                self.log_line.emit(f"Error: {e}")
-                self.finished_signal.emit(self.tunnel_id, 1)
-                return
-            finally:
-                if self._server:
-                    try:
-                        self._server.stop()
-                    except Exception:
-                        pass
-                self.finished_signal.emit(self.tunnel_id, 0 if self._stop_requested else 1)
-
-        self._thread = threading.Thread(target=run_tunnel, daemon=True)
-        self._thread.start()
+        self._log_timer.start()
+        self._s.future = _TUNNEL_EXEC.submit(self._open, ssh_kwargs, local_bind, remote_bind)
         return True
 
-    def stop(self) -> None:
-        self._stop_requested = True
-        if self._server:
+    def _open(self, ssh_kwargs: dict, local_bind: tuple, remote_bind: tuple) -> None:
+        if self._s.stop_event.is_set():
+            return
+        try:
+            pool_key = make_pool_key(
+                self.host.hostname,
+                self.host.port,
+                self.host.username,
+                ssh_kwargs.get("ssh_pkey", ""),
+                ssh_kwargs.get("ssh_password") or ssh_kwargs.get("ssh_private_key_password") or "",
+            )
+            self._s.server = _PooledForwarder(pool_key, self._on_transport_closed, **ssh_kwargs)
+            self._s.server.start()
+        except Exception as e:
+            self._s.log_queue.append(f"Error: {e}")
+            self._close(1)
+            return
+        if self._s.stop_event.is_set():
+            return  # stop() came in while connecting; its teardown runs next
+        self._s.log_queue.append(f"Tunnel started: {local_bind[0]}:{local_bind[1]} -> {remote_bind[0]}:{remote_bind[1]}")
+        self.started_signal.emit(self.tunnel_id)
+
+    def _close(self, exit_code: int) -> None:
+        """Stop the forwarder and emit finished_signal; only the first call does anything."""
+        with self._s.finish_lock:
+            if self._s.finished:
+                return
+            self._s.finished = True
+        if self._s.server:
             try:
-                self._server.stop()
+                self._s.server.stop()
             except Exception:
                 pass
+        self.finished_signal.emit(self.tunnel_id, exit_code)
+
+    def _drain_log(self) -> None:
+        lines = []
+        while self._s.log_queue:
+            lines.append(self._s.log_queue.popleft())
+        if lines:
+            self.log_lines.emit(lines)
+
+    def _on_finished(self, tunnel_id: int, exit_code: int) -> None:
+        # Connected before any outside slot, so queued lines are delivered ahead of the exit
+        self._log_timer.stop()
+        self._drain_log()
+
+    def _on_transport_closed(self) -> None:
+        """Called from the pool's watcher thread when the SSH connection drops."""
+        if self._s.stop_event.is_set():
+            return
+        self._s.stop_event.set()
+        _TUNNEL_EXEC.submit(self._close, 1)
+
+    def stop(self) -> None:
+        if self._s.stop_event.is_set():
+            return
+        self._s.stop_event.set()
+        if self._s.future is None:
+            return
+        # Runs once _open has finished, so a tunnel still connecting is torn down after it comes up
+        self._s.future.add_done_callback(lambda _: _TUNNEL_EXEC.submit(self._close, 0))
 
     def is_running(self) -> bool:
-        return self._server is not None and self._server.is_active
+        return self._s.server is not None and self._s.server.is_active
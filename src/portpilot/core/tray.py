@@ -3,21 +3,39 @@
 from typing import Callable, Optional
 
 from PySide6.QtCore import QObject
-from PySide6.QtGui import QAction, QIcon
+from PySide6.QtGui import QAction, QCursor, QIcon
 from PySide6.QtWidgets import QApplication, QMenu, QSystemTrayIcon
 
 
+class _TrayCallbacks:
+    __slots__ = ("show", "start_all", "stop_all", "quit")
+
+    def __init__(self):
+        self.show: Optional[Callable[[], None]] = None
+        self.start_all: Optional[Callable[[], None]] = None
+        self.stop_all: Optional[Callable[[], None]] = None
+        self.quit: Optional[Callable[[], None]] = None
+
+
 class TrayIcon(QObject):
     """System tray with menu: Show, Start All, Stop All, Quit."""
 
+    # Activation reasons resolved once rather than per click
+    _CONTEXT = QSystemTrayIcon.Context
+    _DBLCLICK = QSystemTrayIcon.DoubleClick
+
     def __init__(self, parent: Optional[QObject] = None):
         super().__init__(parent)
         self._tray = QSystemTrayIcon(parent)
+        self._menu: Optional[QMenu] = None  # built on first activation, see _ensure_menu
+        self._cb = _TrayCallbacks()
+        self._tray.activated.connect(self._on_activated)
+
+    def _ensure_menu(self) -> bool:
+        """Build the context menu if needed. Returns True if it was just built."""
+        if self._menu is not None:
+            return False
         self._menu = QMenu()
-        self._on_show: Optional[Callable[[], None]] = None
-        self._on_start_all: Optional[Callable[[], None]] = None
-        self._on_stop_all: Optional[Callable[[], None]] = None
-        self._on_quit: Optional[Callable[[], None]] = None
 
         act_show = QAction("Show", self)
         act_show.triggered.connect(self._handle_show)
@@ -40,7 +58,7 @@ class TrayIcon(QObject):
         self._menu.addAction(act_quit)
 
         self._tray.setContextMenu(self._menu)
-        self._tray.activated.connect(self._on_activated)
+        return True
 
     def set_icon(self, icon: QIcon) -> None:
         self._tray.setIcon(icon)
@@ -61,27 +79,32 @@ class TrayIcon(QObject):
         on_stop_all: Optional[Callable[[], None]] = None,
         on_quit: Optional[Callable[[], None]] = None,
     ) -> None:
-        self._on_show = on_show
-        self._on_start_all = on_start_all
-        self._on_stop_all = on_stop_all
-        self._on_quit = on_quit
+        cb = self._cb
+        cb.show = on_show
+        cb.start_all = on_start_all
+        cb.stop_all = on_stop_all
+        cb.quit = on_quit
 
     def _on_activated(self, reason: QSystemTrayIcon.ActivationReason) -> None:
-        if reason == QSystemTrayIcon.DoubleClick:
+        built = self._ensure_menu()
+        if reason == self._CONTEXT and built:
+            # The platform looked for a context menu before we had one; show it ourselves this once
+            self._menu.popup(QCursor.pos())
+        elif reason == self._DBLCLICK:
             self._handle_show()
 
     def _handle_show(self) -> None:
-        if self._on_show:
-            self._on_show()
+        if self._cb.show:
+            self._cb.show()
 
     def _handle_start_all(self) -> None:
-        if self._on_start_all:
-            self._on_start_all()
+        if self._cb.start_all:
+            self._cb.start_all()
 
     def _handle_stop_all(self) -> None:
-        if self._on_stop_all:
-            self._on_stop_all()
+        if self._cb.stop_all:
+            self._cb.stop_all()
 
     def _handle_quit(self) -> None:
-        if self._on_quit:
-            self._on_quit()
+        if self._cb.quit:
+            self._cb.quit()
@@ -1,9 +1,10 @@
 """Dialog windows for PortPilot."""
 
+import ipaddress
 import re
+import string
 from typing import Optional
 
-from PySide6.QtCore import Qt
 from PySide6.QtWidgets import (
     QCheckBox,
     QComboBox,
@@ -12,19 +13,17 @@ from PySide6.QtWidgets import (
     QFormLayout,
     QGroupBox,
     QLabel,
-    QLineEdit,
-    QMessageBox,
-    QSpinBox,
     QVBoxLayout,
     QWidget,
 )
 
 from ..core.models import Host, Tunnel
-from .widgets import ErrorLabel, SectionHeader, StyledLineEdit, StyledSpinBox, apply_base_style
+from .widgets import ErrorLabel, StyledLineEdit, StyledSpinBox, apply_base_style
 
-
-def validate_port(value: int) -> bool:
-    return 1 <= value <= 65535
+# Plain ASCII hostnames are checked against this set; the regex handles the rest
+_HOSTCHARS = frozenset(string.ascii_letters + string.digits + ".-_")
+# \Z rather than $ so a trailing newline doesn't validate
+_HOSTNAME_RE = re.compile(r"^[\w.-]+\Z")
 
 
 def validate_hostname(s: str) -> bool:
@@ -32,17 +31,33 @@ def validate_hostname(s: str) -> bool:
         return False
     # Basic hostname/IP validation
     s = s.strip()
-    if re.match(r"^[\w.-]+$", s):
-        return True
-    # IPv4
-    if re.match(r"^\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3}$", s):
+    # IPv4 addresses end in a digit and IPv6 ones contain ':'; skip the parse for other names
+    if ":" in s or s[-1].isdigit():
+        try:
+            ipaddress.ip_address(s)
+            return True
+        except ValueError:
+            pass
+        if s.count(".") == 3 and all(p.isascii() and p.isdigit() for p in s.split(".")):
+            return False  # dotted quad that isn't a real IPv4 address
+    if _HOSTCHARS.issuperset(s):
         return True
-    return False
+    return _HOSTNAME_RE.match(s) is not None
 
 
 class HostEditDialog(QDialog):
     """Add/Edit Host dialog."""
 
+    # Main form rows: (attribute, widget class, label, placeholder)
+    _FIELDS = (
+        ("name_edit", StyledLineEdit, "Name:", "My Server"),
+        ("hostname_edit", StyledLineEdit, "Hostname:", "example.com or 192.168.1.1"),
+        ("port_spin", StyledSpinBox, "Port:", None),
+        ("username_edit", StyledLineEdit, "Username:", "username"),
+        ("identity_edit", StyledLineEdit, "Identity file:", "e.g. C:\\Users\\You\\.ssh\\id_rsa (optional for password auth)"),
+        ("extra_args_edit", StyledLineEdit, "Extra SSH args:", "Optional: -o StrictHostKeyChecking=no"),
+    )
+
     def __init__(self, host: Optional[Host] = None, parent=None):
         super().__init__(parent)
         apply_base_style(self)
@@ -52,29 +67,14 @@ class HostEditDialog(QDialog):
         layout = QVBoxLayout(self)
 
         form = QFormLayout()
-        self.name_edit = StyledLineEdit()
-        self.name_edit.setPlaceholderText("My Server")
-        form.addRow("Name:", self.name_edit)
-
-        self.hostname_edit = StyledLineEdit()
-        self.hostname_edit.setPlaceholderText("example.com or 192.168.1.1")
-        form.addRow("Hostname:", self.hostname_edit)
-
-        self.port_spin = StyledSpinBox()
+        for attr, cls, label, placeholder in self._FIELDS:
+            w = cls()
+            if placeholder:
+                w.setPlaceholderText(placeholder)
+            setattr(self, attr, w)
+            form.addRow(label, w)
+        self.port_spin.setRange(1, 65535)
         self.port_spin.setValue(22)
-        form.addRow("Port:", self.port_spin)
-
-        self.username_edit = StyledLineEdit()
-        self.username_edit.setPlaceholderText("username")
-        form.addRow("Username:", self.username_edit)
-
-        self.identity_edit = StyledLineEdit()
-        self.identity_edit.setPlaceholderText("e.g. C:\\Users\\You\\.ssh\\id_rsa (optional for password auth)")
-        form.addRow("Identity file:", self.identity_edit)
-
-        self.extra_args_edit = StyledLineEdit()
-        self.extra_args_edit.setPlaceholderText("Optional: -o StrictHostKeyChecking=no")
-        form.addRow("Extra SSH args:", self.extra_args_edit)
 
         keepalive_group = QGroupBox("Keepalive")
         keepalive_layout = QFormLayout()
@@ -104,6 +104,14 @@ class HostEditDialog(QDialog):
         buttons.rejected.connect(self.reject)
         layout.addWidget(buttons)
 
+        # Text fields changed since the last validate(); the others reuse _stripped/_field_errors
+        self._text_fields = {"name": self.name_edit, "hostname": self.hostname_edit, "username": self.username_edit}
+        self._dirty = set(self._text_fields)
+        self._stripped: dict[str, str] = {}
+        self._field_errors: dict[str, str] = {}
+        for field, edit in self._text_fields.items():
+            edit.textChanged.connect(lambda _text, f=field: self._dirty.add(f))
+
         if host:
             self.name_edit.setText(host.name)
             self.hostname_edit.setText(host.hostname)
@@ -114,12 +122,17 @@ class HostEditDialog(QDialog):
             self.keepalive_interval.setValue(host.keepalive_interval)
             self.keepalive_countmax.setValue(host.keepalive_countmax or 3)
 
+    def _stripped_text(self, field: str) -> str:
+        if field in self._dirty or field not in self._stripped:
+            self._stripped[field] = self._text_fields[field].text().strip()
+        return self._stripped[field]
+
     def get_host(self) -> Host:
         return Host(
             id=None,
-            name=self.name_edit.text().strip(),
-            username=self.username_edit.text().strip(),
-            hostname=self.hostname_edit.text().strip(),
+            name=self._stripped_text("name"),
+            username=self._stripped_text("username"),
+            hostname=self._stripped_text("hostname"),
             port=self.port_spin.value(),
             identity_file=self.identity_edit.text().strip(),
             extra_args=self.extra_args_edit.text().strip(),
@@ -129,23 +142,32 @@ class HostEditDialog(QDialog):
             updated_at=None,
         )
 
+    def _check_field(self, field: str) -> str:
+        """Error message for one text field, or "" if it is valid."""
+        text = self._stripped_text(field)
+        if field == "name":
+            return "" if text else "Name is required"
+        if field == "hostname":
+            return "" if validate_hostname(text) else "Valid hostname or IP required"
+        return "" if text else "Username is required"
+
     def validate(self) -> bool:
-        self.name_error.clear_error()
-        self.hostname_error.clear_error()
-        self.username_error.clear_error()
+        for field in self._dirty:
+            self._field_errors[field] = self._check_field(field)
+        self._dirty.clear()
         ok = True
-        if not self.name_edit.text().strip():
-            self.name_error.show_error("Name is required")
-            ok = False
-        if not validate_hostname(self.hostname_edit.text()):
-            self.hostname_error.show_error("Valid hostname or IP required")
-            ok = False
-        if not self.username_edit.text().strip():
-            self.username_error.show_error("Username is required")
-            ok = False
-        if not validate_port(self.port_spin.value()):
-            self.hostname_error.show_error("Port must be 1-65535")
-            ok = False
+        for field, edit, label in (
+            ("name", self.name_edit, self.name_error),
+            ("hostname", self.hostname_edit, self.hostname_error),
+            ("username", self.username_edit, self.username_error),
+        ):
+            msg = self._field_errors[field]
+            edit.set_error(bool(msg))
+            if msg:
+                label.show_error(msg)
+                ok = False
+            else:
+                label.clear_error()
         return ok
 
     def accept(self) -> None:
@@ -156,6 +178,13 @@ class HostEditDialog(QDialog):
 class TunnelEditDialog(QDialog):
     """Add/Edit Tunnel dialog."""
 
+    # Which type-specific rows are shown, by type_combo index (Local, Remote, Dynamic)
+    _VIS_BY_TYPE = {
+        0: {"local_bind": True, "local_port": True, "remote_host": True, "remote_port": True, "remote_bind": False, "socks_port": False},
+        1: {"local_bind": False, "local_port": True, "remote_host": True, "remote_port": True, "remote_bind": True, "socks_port": False},
+        2: {"local_bind": True, "local_port": False, "remote_host": False, "remote_port": False, "remote_bind": False, "socks_port": True},
+    }
+
     def __init__(self, tunnel: Tunnel, parent=None):
         super().__init__(parent)
         apply_base_style(self)
@@ -176,6 +205,7 @@ class TunnelEditDialog(QDialog):
         form.addRow("Type:", self.type_combo)
 
         self._type_rows: dict[str, tuple[QWidget, QWidget]] = {}
+        self._last_vis: dict[str, bool] = {}
 
         def add_type_row(label: str, widget: QWidget, key: str) -> None:
             lbl = QLabel(label)
@@ -188,6 +218,7 @@ class TunnelEditDialog(QDialog):
         add_type_row("Local bind:", self.local_bind_edit, "local_bind")
 
         self.local_port_spin = StyledSpinBox()
+        self.local_port_spin.setRange(1, 65535)
         self.local_port_spin.setValue(8080)
         add_type_row("Local port:", self.local_port_spin, "local_port")
 
@@ -196,6 +227,7 @@ class TunnelEditDialog(QDialog):
         add_type_row("Remote host:", self.remote_host_edit, "remote_host")
 
         self.remote_port_spin = StyledSpinBox()
+        self.remote_port_spin.setRange(1, 65535)
         self.remote_port_spin.setValue(80)
         add_type_row("Remote port:", self.remote_port_spin, "remote_port")
 
@@ -206,6 +238,7 @@ class TunnelEditDialog(QDialog):
 
         # Dynamic (-D)
         self.socks_port_spin = StyledSpinBox()
+        self.socks_port_spin.setRange(1, 65535)
         self.socks_port_spin.setValue(1080)
         add_type_row("SOCKS port:", self.socks_port_spin, "socks_port")
 
@@ -214,8 +247,6 @@ class TunnelEditDialog(QDialog):
 
         self.name_error = ErrorLabel()
         form.addRow("", self.name_error)
-        self.port_error = ErrorLabel()
-        form.addRow("", self.port_error)
 
         layout.addLayout(form)
 
@@ -237,26 +268,36 @@ class TunnelEditDialog(QDialog):
         self.open_terminal_cb.setChecked(tunnel.open_terminal)
         self._on_type_changed()
 
+        # Stripped name, shared by validate() and get_tunnel(); reset when the text changes
+        self._name: Optional[str] = None
+        self.name_edit.textChanged.connect(self._on_name_changed)
+
+    def _on_name_changed(self) -> None:
+        self._name = None
+
+    def _stripped_name(self) -> str:
+        if self._name is None:
+            self._name = self.name_edit.text().strip()
+        return self._name
+
     def _on_type_changed(self) -> None:
         idx = self.type_combo.currentIndex()
-        is_local = idx == 0
         is_remote = idx == 1
-        is_dynamic = idx == 2
-        vis = {
-            "local_bind": is_local or is_dynamic,
-            "local_port": is_local or is_remote,
-            "remote_host": is_local or is_remote,
-            "remote_port": is_local or is_remote,
-            "remote_bind": is_remote,
-            "socks_port": is_dynamic,
-        }
+        vis = self._VIS_BY_TYPE[idx]
+        # Toggle only rows whose visibility changed, with repaints held until the end
+        self.setUpdatesEnabled(False)
         for key, visible in vis.items():
+            if self._last_vis.get(key) == visible:
+                continue
             lbl, w = self._type_rows[key]
             lbl.setVisible(visible)
             w.setVisible(visible)
+        self._last_vis = vis
         # For -R, "remote_host" is actually local host (where server connects back)
         rh_lbl = self._type_rows["remote_host"][0]
         rh_lbl.setText("Local host:" if is_remote else "Remote host:")
+        self.layout().activate()
+        self.setUpdatesEnabled(True)
 
     def get_tunnel(self) -> Tunnel:
         idx = self.type_combo.currentIndex()
@@ -271,7 +312,7 @@ class TunnelEditDialog(QDialog):
         return Tunnel(
             id=self.tunnel.id,
             host_id=self.tunnel.host_id,
-            name=self.name_edit.text().strip(),
+            name=self._stripped_name(),
             type=t,
             local_bind=self.local_bind_edit.text().strip() or "127.0.0.1",
             local_port=self.local_port_spin.value(),
@@ -286,22 +327,11 @@ class TunnelEditDialog(QDialog):
 
     def validate(self) -> bool:
         self.name_error.clear_error()
-        self.port_error.clear_error()
         ok = True
-        if not self.name_edit.text().strip():
+        if not self._stripped_name():
             self.name_error.show_error("Name is required")
             ok = False
-        idx = self.type_combo.currentIndex()
-        if idx == 0 or idx == 1:
-            for spin in [self.local_port_spin, self.remote_port_spin]:
-                if not validate_port(spin.value()):
-                    self.port_error.show_error("Ports must be 1-65535")
-                    ok = False
-                    break
-        elif idx == 2:
-            if not validate_port(self.socks_port_spin.value()):
-                self.port_error.show_error("SOCKS port must be 1-65535")
-                ok = False
+        self.name_edit.set_error(not ok)
         return ok
 
     def accept(self) -> None:
@@ -0,0 +1,44 @@
+"""Host sidebar model: the hosts matching the current search."""
+
+from typing import Any, Optional
+
+from PySide6.QtCore import QAbstractListModel, QModelIndex, Qt
+
+from ..core.models import Host
+
+
+class HostListModel(QAbstractListModel):
+    """Host names for the sidebar; Qt.UserRole gives the host id."""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._hosts: list[Host] = []
+
+    def set_hosts(self, hosts: list[Host]) -> None:
+        self.beginResetModel()
+        self._hosts = hosts
+        self.endResetModel()
+
+    def host_id(self, row: int) -> Optional[int]:
+        if 0 <= row < len(self._hosts):
+            return self._hosts[row].id
+        return None
+
+    def row_of(self, host_id: int) -> Optional[int]:
+        for row, h in enumerate(self._hosts):
+            if h.id == host_id:
+                return row
+        return None
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._hosts)
+
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole) -> Any:
+        if not index.isValid():
+            return None
+        h = self._hosts[index.row()]
+        if role == Qt.DisplayRole:
+            return h.name
+        if role == Qt.UserRole:
+            return h.id
+        return None
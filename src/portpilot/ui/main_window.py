@@ -1,25 +1,26 @@
 """Main window for PortPilot."""
 
+import codecs
+import mmap
 import os
-import subprocess
-import sys
-from datetime import datetime
+import time
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Optional
+from typing import Iterator, Optional
 
-from PySide6.QtCore import QTimer, Qt
-from PySide6.QtGui import QAction, QIcon
+from PySide6.QtCore import QEvent, QFileSystemWatcher, QModelIndex, QObject, QSocketNotifier, QTimer, Qt, QUrl, Signal
+from PySide6.QtGui import QAction, QDesktopServices, QIcon
 from PySide6.QtWidgets import (
     QAbstractItemView,
     QApplication,
-    QCheckBox,
     QFormLayout,
     QHBoxLayout,
     QHeaderView,
     QLabel,
     QLineEdit,
-    QListWidget,
-    QListWidgetItem,
+    QListView,
     QMainWindow,
     QMessageBox,
     QPushButton,
@@ -27,8 +28,7 @@ from PySide6.QtWidgets import (
     QSpinBox,
     QSplitter,
     QTabWidget,
-    QTableWidget,
-    QTableWidgetItem,
+    QTableView,
     QVBoxLayout,
     QWidget,
 )
@@ -41,54 +41,203 @@ from ..core.db import (
     get_tunnel,
     insert_host,
     insert_run,
+    insert_runs,
     insert_tunnel,
     list_hosts,
+    list_open_detached_runs,
     list_tunnels,
+    list_tunnels_with_latest_exit,
+    submit_run,
     update_host,
+    update_latest_run_stopped,
     update_run_log_path,
     update_run_stopped,
     update_tunnel,
 )
 from ..core.models import Host, Run, Tunnel
 from ..core.process_manager import (
+    DetachedLauncher,
     ManagedTunnelProcess,
-    _delete_password_file,
+    _log_path_for_tunnel,
+    is_ssh_process,
     kill_process_tree,
-    is_process_alive,
-    start_detached,
+    kill_process_trees,
+    open_exit_fd,
+    reap_if_exited,
+    stop_managed,
 )
 from ..core.sshtunnel_runner import SSHTunnelRunner
 from ..core.settings import get_icon_path, get_logs_dir
 from ..core.ssh_builder import find_ssh
 from ..core.tray import TrayIcon
-from .dialogs import CloseConfirmDialog, HostEditDialog, TunnelEditDialog
+from .host_list import HostListModel
 from .password_dialog import PasswordDialog
+from .tunnel_table import (
+    COL_ACTIONS,
+    COL_BACKGROUND,
+    COL_ENDPOINT,
+    COL_NAME,
+    COL_STATUS,
+    COL_TYPE,
+    StatusPillDelegate,
+    TunnelActionsDelegate,
+    TunnelTableModel,
+)
 from .widgets import (
     EmptyState,
     LogViewer,
     SectionHeader,
-    StatusPill,
     apply_base_style,
-    primary_button_style,
-    secondary_button_style,
     show_setup_message,
 )
 
 
-def tunnel_endpoint_summary(t: Tunnel) -> str:
-    """Human-readable endpoint summary for tunnel table."""
-    if t.type == "local":
-        return f"localhost:{t.local_port} → {t.remote_host}:{t.remote_port}"
-    if t.type == "remote":
-        return f"remote:{t.remote_port} ← {t.remote_host}:{t.local_port}"
-    if t.type == "dynamic":
-        return f"SOCKS5 localhost:{t.socks_port}"
-    return ""
+# Tunnel statuses are re-polled on this interval while the table is on screen (ms)
+STATUS_REFRESH_MS = 3000
+
+# Incoming log lines are appended to the viewer in one batch per interval (ms)
+LOG_APPEND_INTERVAL_MS = 100
+
+# Host search waits this long after the last keystroke before querying (ms)
+HOST_SEARCH_DEBOUNCE_MS = 150
+
+# Only this much of the end of a log file is loaded into the viewer (bytes)
+LOG_TAIL_BYTES = 256 * 1024
+
+# Tails of log files larger than this are read through a memory map (bytes)
+LOG_MMAP_THRESHOLD = 4 * 1024 * 1024
+
+# A followed log file is read and decoded in chunks of this size (bytes)
+LOG_READ_CHUNK_BYTES = 64 * 1024
+
+# Decoded tails of this many recently shown log files are kept for re-selection
+LOG_TAIL_CACHE_SIZE = 8
+
+# Log files are read off the GUI thread, one at a time
+_LOG_READ_EXEC = ThreadPoolExecutor(max_workers=1, thread_name_prefix="logread")
+
+# Default for _get_tunnel_status: look the latest run up (None is a real exit code)
+_FETCH = object()
+
+
+@contextmanager
+def _batched_updates(view: QAbstractItemView) -> Iterator[None]:
+    """Hold off painting and the view's own signals while it is repopulated; repaint once after."""
+    view.setUpdatesEnabled(False)
+    was_blocked = view.blockSignals(True)
+    try:
+        yield
+    finally:
+        view.blockSignals(was_blocked)
+        view.setUpdatesEnabled(True)
+        view.viewport().update()
+
+
+def _new_managed_run(tunnel_id: int) -> Run:
+    return Run(
+        id=None,
+        tunnel_id=tunnel_id,
+        started_at=int(time.time()),
+        stopped_at=None,
+        pid=None,
+        mode="managed",
+        exit_code=None,
+        log_path=None,
+        last_error=None,
+    )
+
+
+def _read_log_tail(log_path: Path) -> tuple[str, int]:
+    """Decode the last LOG_TAIL_BYTES of a log, marking the text as truncated if it was cut.
+
+    Also returns the file offset the read ended at.
+    """
+    with log_path.open("rb") as f:
+        size = f.seek(0, os.SEEK_END)
+        start = max(0, size - LOG_TAIL_BYTES)
+        if size > LOG_MMAP_THRESHOLD:
+            # Map only the tail; the offset has to be a multiple of the allocation granularity
+            offset = start - start % mmap.ALLOCATIONGRANULARITY
+            with mmap.mmap(f.fileno(), size - offset, offset=offset, access=mmap.ACCESS_READ) as mm:
+                data = mm[start - offset :]
+        else:
+            f.seek(start)
+            data = f.read()
+    end = start + len(data)
+    if start:
+        # Drop the partial line the cut landed in
+        data = data.split(b"\n", 1)[1] if b"\n" in data else b""
+    text = data.decode("utf-8", errors="replace")
+    if start:
+        text = "(… truncated, open file for full view)\n" + text
+    return text, end
+
+
+def _lines_not_in(text: str, lines: list[str]) -> list[str]:
+    """lines minus any leading run of them that text already ends with.
+
+    Live lines held during a file read may have reached the file before it was read.
+    Blank lines are skipped on the text side, as the runners skip them too.
+    """
+    shown = [line for line in text.splitlines() if line.strip()]
+    for k in range(min(len(shown), len(lines)), 0, -1):
+        if shown[-k:] == lines[:k]:
+            return lines[k:]
+    return lines
+
+
+class _LogTailReader(QObject):
+    """Reads log tails on _LOG_READ_EXEC; the text is delivered on the reader's thread."""
+
+    loaded = Signal(int, int, str, object, object)  # request id, tunnel_id, viewer text, log path, end offset or None
+
+    def __init__(self, parent: Optional[QObject] = None):
+        super().__init__(parent)
+        # (path, mtime_ns, size) -> (tail text, end offset), least recently shown first.
+        # Only touched by the single _LOG_READ_EXEC worker; a changed file gets a new key.
+        self._cache: OrderedDict[tuple[str, int, int], tuple[str, int]] = OrderedDict()
+
+    def read(self, request_id: int, tunnel_id: int, log_path: Optional[Path]) -> None:
+        _LOG_READ_EXEC.submit(self._run, request_id, tunnel_id, log_path)
+
+    def _run(self, request_id: int, tunnel_id: int, log_path: Optional[Path]) -> None:
+        text, end = self._tail_text(log_path)
+        self.loaded.emit(request_id, tunnel_id, text, log_path, end)
+
+    def _tail_text(self, log_path: Optional[Path]) -> tuple[str, Optional[int]]:
+        if not log_path:
+            return "(No log yet)", None
+        try:
+            st = log_path.stat()
+        except OSError:
+            return "(No log yet)", None
+        key = (str(log_path), st.st_mtime_ns, st.st_size)
+        tail = self._cache.get(key)
+        if tail is not None:
+            self._cache.move_to_end(key)
+            return tail
+        try:
+            tail = _read_log_tail(log_path)
+        except Exception:
+            return "(Could not read log file)", None
+        self._cache[key] = tail
+        if len(self._cache) > LOG_TAIL_CACHE_SIZE:
+            self._cache.popitem(last=False)
+        return tail
 
 
 class MainWindow(QMainWindow):
     """PortPilot main window."""
 
+    # Actions painted in the tunnels table -> handler method
+    _TUNNEL_ACTIONS = {
+        "start": "_on_start_tunnel",
+        "stop": "_on_stop_tunnel",
+        "restart": "_on_restart_tunnel",
+        "edit": "_on_edit_tunnel",
+        "delete": "_on_delete_tunnel",
+    }
+
     def __init__(self):
         super().__init__()
         self.setWindowTitle("PortPilot - SSH Port Forward Manager")
@@ -100,20 +249,49 @@ class MainWindow(QMainWindow):
         self._central = QWidget()
         self.setCentralWidget(self._central)
         self._managed_processes: dict[int, ManagedTunnelProcess] = {}
+        # Managed/detached tunnels launched but not yet up; Start and Stop are disabled for them
+        self._starting: set[int] = set()
+        # Starting tunnels stopped (or deleted) meanwhile; they are killed as soon as they come up
+        self._cancel_on_start: set[int] = set()
+        self._pending_launches: dict[int, Future] = {}  # tunnel_id -> detached launch in flight
         self._sshtunnel_runners: dict[int, SSHTunnelRunner] = {}
         self._detached_pids: dict[int, int] = {}  # tunnel_id -> pid
+        # tunnel_id -> notifier on the detached pid's pidfd; such pids are not polled
+        self._pid_watchers: dict[int, QSocketNotifier] = {}
         self._run_in_background: dict[int, bool] = {}  # tunnel_id -> bool (per-run toggle)
         self._log_paths: dict[int, Path] = {}  # tunnel_id -> log path for current run
         self._selected_log_tunnel: Optional[int] = None
+        self._log_pending: list[tuple[int, str]] = []  # (tunnel_id, line) awaiting _flush_log
+        self._log_flush_timer = QTimer(self)
+        self._log_flush_timer.setSingleShot(True)
+        self._log_flush_timer.setInterval(LOG_APPEND_INTERVAL_MS)
+        self._log_flush_timer.timeout.connect(self._flush_log)
+        self._launcher = DetachedLauncher(self)
+        self._launcher.launched.connect(self._on_detached_launched)
+        self._log_reader = _LogTailReader(self)
+        self._log_reader.loaded.connect(self._on_log_loaded)
+        self._log_request_id = 0  # only the latest _show_log_for_tunnel read is shown
+        self._log_loading = False  # a file read for the selected tunnel is on its way
+        self._log_held: list[str] = []  # live lines that arrived while it was
+        # Detached tunnels only write to their log file; the shown one is followed for new output
+        self._log_watcher = QFileSystemWatcher(self)
+        self._log_watcher.fileChanged.connect(self._on_log_file_changed)
+        self._log_tail_path: Optional[Path] = None
+        self._log_tail_offset = 0
+        self._log_tail_decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+        self._log_tail_rest = ""  # decoded text after the last newline, not shown yet
 
         self._build_ui()
         self._setup_tray()
         self._connect_signals()
-        self._load_hosts()
         self._detect_running_tunnels()
+        self._load_hosts()
         self._status_timer = QTimer(self)
+        self._status_timer.setInterval(STATUS_REFRESH_MS)
         self._status_timer.timeout.connect(self._refresh_tunnel_statuses)
-        self._status_timer.start(3000)
+        # Started by showEvent; paused while hidden, minimized or on another tab
+        self.tabs.currentChanged.connect(self._update_status_timer)
+        self.tabs.currentChanged.connect(self._on_tab_changed)
 
     def _build_ui(self) -> None:
         layout = QVBoxLayout(self._central)
@@ -124,10 +302,10 @@ class MainWindow(QMainWindow):
         top_bar = QHBoxLayout()
         top_bar.addStretch()
         self.start_all_btn = QPushButton("Start All")
-        self.start_all_btn.setStyleSheet(primary_button_style())
+        self.start_all_btn.setObjectName("primary")
         self.start_all_btn.clicked.connect(self._on_start_all)
         self.stop_all_btn = QPushButton("Stop All")
-        self.stop_all_btn.setStyleSheet(secondary_button_style())
+        self.stop_all_btn.setObjectName("secondary")
         self.stop_all_btn.clicked.connect(self._on_stop_all)
         top_bar.addWidget(self.start_all_btn)
         top_bar.addWidget(self.stop_all_btn)
@@ -142,16 +320,23 @@ class MainWindow(QMainWindow):
         sidebar_layout.setContentsMargins(0, 0, 0, 0)
         self.host_search = QLineEdit()
         self.host_search.setPlaceholderText("Search hosts...")
-        self.host_search.textChanged.connect(self._load_hosts)
+        self._host_reload_timer = QTimer(self)
+        self._host_reload_timer.setSingleShot(True)
+        self._host_reload_timer.setInterval(HOST_SEARCH_DEBOUNCE_MS)
+        self._host_reload_timer.timeout.connect(self._load_hosts)
+        self.host_search.textChanged.connect(self._schedule_host_reload)
         sidebar_layout.addWidget(self.host_search)
 
-        self.host_list = QListWidget()
+        self.host_list = QListView()
+        self._host_model = HostListModel(self)
+        self.host_list.setModel(self._host_model)
         self.host_list.setSelectionMode(QAbstractItemView.SingleSelection)
-        self.host_list.currentItemChanged.connect(self._on_host_selected)
+        self.host_list.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.host_list.selectionModel().currentChanged.connect(self._on_host_selected)
         sidebar_layout.addWidget(self.host_list)
 
         new_host_btn = QPushButton("New Host")
-        new_host_btn.setStyleSheet(primary_button_style())
+        new_host_btn.setObjectName("primary")
         new_host_btn.clicked.connect(self._on_new_host)
         sidebar_layout.addWidget(new_host_btn)
 
@@ -183,10 +368,10 @@ class MainWindow(QMainWindow):
         log_header.addWidget(SectionHeader("Log"))
         log_header.addStretch()
         self.copy_logs_btn = QPushButton("Copy logs")
-        self.copy_logs_btn.setStyleSheet(secondary_button_style())
+        self.copy_logs_btn.setObjectName("secondary")
         self.copy_logs_btn.clicked.connect(self._on_copy_logs)
         self.open_log_btn = QPushButton("Open log file")
-        self.open_log_btn.setStyleSheet(secondary_button_style())
+        self.open_log_btn.setObjectName("secondary")
         self.open_log_btn.clicked.connect(self._on_open_log_file)
         log_header.addWidget(self.copy_logs_btn)
         log_header.addWidget(self.open_log_btn)
@@ -202,31 +387,36 @@ class MainWindow(QMainWindow):
 
     def _build_tunnels_tab(self) -> None:
         layout = QVBoxLayout(self.tunnels_tab)
-        self.tunnels_table = QTableWidget()
-        self.tunnels_table.setColumnCount(7)
-        self.tunnels_table.setHorizontalHeaderLabels(
-            ["Name", "Type", "Endpoint", "Status", "Background", "Actions", ""]
-        )
+        self.tunnels_table = QTableView()
+        self._tunnel_model = TunnelTableModel(self._run_in_background, self)
+        self.tunnels_table.setModel(self._tunnel_model)
+        self.tunnels_table.setItemDelegateForColumn(COL_STATUS, StatusPillDelegate(self.tunnels_table))
+        actions_delegate = TunnelActionsDelegate(self.tunnels_table)
+        # Queued so a dialog opened by the action runs after the view has finished the click
+        actions_delegate.action_triggered.connect(self._on_tunnel_action, Qt.QueuedConnection)
+        self.tunnels_table.setItemDelegateForColumn(COL_ACTIONS, actions_delegate)
         header = self.tunnels_table.horizontalHeader()
-        header.setSectionResizeMode(0, QHeaderView.ResizeMode.Interactive)
-        header.setSectionResizeMode(1, QHeaderView.ResizeMode.Interactive)
-        header.setSectionResizeMode(2, QHeaderView.ResizeMode.Stretch)
-        header.setSectionResizeMode(3, QHeaderView.ResizeMode.Interactive)
-        header.setSectionResizeMode(4, QHeaderView.ResizeMode.Fixed)
-        header.setSectionResizeMode(5, QHeaderView.ResizeMode.Fixed)
-        header.setSectionResizeMode(6, QHeaderView.ResizeMode.Fixed)
+        header.setSectionResizeMode(COL_NAME, QHeaderView.ResizeMode.Interactive)
+        header.setSectionResizeMode(COL_TYPE, QHeaderView.ResizeMode.Interactive)
+        header.setSectionResizeMode(COL_ENDPOINT, QHeaderView.ResizeMode.Stretch)
+        header.setSectionResizeMode(COL_STATUS, QHeaderView.ResizeMode.Interactive)
+        header.setSectionResizeMode(COL_BACKGROUND, QHeaderView.ResizeMode.Fixed)
+        header.setSectionResizeMode(COL_ACTIONS, QHeaderView.ResizeMode.Fixed)
         header.setMinimumSectionSize(60)
-        self.tunnels_table.setColumnWidth(0, 120)
-        self.tunnels_table.setColumnWidth(1, 95)
-        self.tunnels_table.setColumnWidth(3, 110)
-        self.tunnels_table.setColumnWidth(4, 90)
-        self.tunnels_table.setColumnWidth(5, 380)
-        self.tunnels_table.setColumnWidth(6, 0)
+        self.tunnels_table.setColumnWidth(COL_NAME, 120)
+        self.tunnels_table.setColumnWidth(COL_TYPE, 95)
+        self.tunnels_table.setColumnWidth(COL_STATUS, 110)
+        self.tunnels_table.setColumnWidth(COL_BACKGROUND, 90)
+        self.tunnels_table.setColumnWidth(COL_ACTIONS, 380)
         self.tunnels_table.setSelectionBehavior(QAbstractItemView.SelectRows)
         self.tunnels_table.setSelectionMode(QAbstractItemView.SingleSelection)
         self.tunnels_table.setEditTriggers(QAbstractItemView.NoEditTriggers)
-        self.tunnels_table.itemSelectionChanged.connect(self._on_tunnel_selected)
+        self.tunnels_table.selectionModel().selectionChanged.connect(self._on_tunnel_selected)
+        # Fixed row heights: the view never measures rows from their contents
+        self.tunnels_table.verticalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
         self.tunnels_table.verticalHeader().setDefaultSectionSize(44)
+        self.tunnels_table.setVerticalScrollMode(QAbstractItemView.ScrollPerPixel)
+        self.tunnels_table.setHorizontalScrollMode(QAbstractItemView.ScrollPerPixel)
         self.tunnels_table.setWordWrap(False)
         self.tunnels_table.setTextElideMode(Qt.TextElideMode.ElideRight)
         self.tunnels_table.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
@@ -234,7 +424,7 @@ class MainWindow(QMainWindow):
 
         btn_row = QHBoxLayout()
         self.new_tunnel_btn = QPushButton("New Tunnel")
-        self.new_tunnel_btn.setStyleSheet(primary_button_style())
+        self.new_tunnel_btn.setObjectName("primary")
         self.new_tunnel_btn.clicked.connect(self._on_new_tunnel)
         btn_row.addWidget(self.new_tunnel_btn)
         btn_row.addStretch()
@@ -251,10 +441,16 @@ class MainWindow(QMainWindow):
         layout = QVBoxLayout(self.settings_tab)
         self.settings_empty = EmptyState("Select a host to edit its settings.", self.settings_tab)
         layout.addWidget(self.settings_empty)
+        # The form itself is built by _ensure_settings_form the first time the tab is opened
+        self.settings_form: Optional[QWidget] = None
+
+    def _ensure_settings_form(self) -> None:
+        if self.settings_form is not None:
+            return
         self.settings_form = QWidget()
         settings_form_layout = QVBoxLayout(self.settings_form)
         self.settings_form.setVisible(False)
-        layout.addWidget(self.settings_form)
+        self.settings_tab.layout().addWidget(self.settings_form)
 
         # Host settings form (reuse HostEditDialog fields conceptually, or inline form)
         self.settings_name = QLineEdit()
@@ -281,7 +477,7 @@ class MainWindow(QMainWindow):
         settings_form_layout.addLayout(fl)
 
         save_btn = QPushButton("Save")
-        save_btn.setStyleSheet(primary_button_style())
+        save_btn.setObjectName("primary")
         save_btn.clicked.connect(self._on_save_host)
         delete_btn = QPushButton("Delete Host")
         delete_btn.setStyleSheet("color: #dc2626;")
@@ -327,24 +523,27 @@ class MainWindow(QMainWindow):
     def _connect_signals(self) -> None:
         pass
 
+    def _schedule_host_reload(self) -> None:
+        """Restart the debounce timer so only the last keystroke of a burst reloads."""
+        self._host_reload_timer.start()
+
     def _load_hosts(self) -> None:
+        self._host_reload_timer.stop()
         search = self.host_search.text() if hasattr(self, "host_search") else ""
-        hosts = list_hosts(search)
-        self.host_list.clear()
-        for h in hosts:
-            item = QListWidgetItem(h.name)
-            item.setData(Qt.UserRole, h.id)
-            self.host_list.addItem(item)
-        if hosts and not self.host_list.currentItem():
-            self.host_list.setCurrentRow(0)
-
-    def _on_host_selected(self, current: Optional[QListWidgetItem], previous: Optional[QListWidgetItem]) -> None:
-        if not current:
+        self._host_model.set_hosts(list_hosts(search))
+        # A model reset drops the current index without signalling, so report the new one here
+        if self._host_model.rowCount():
+            self.host_list.setCurrentIndex(self._host_model.index(0))
+        else:
+            self._on_host_selected(QModelIndex(), QModelIndex())
+
+    def _on_host_selected(self, current: QModelIndex, previous: QModelIndex) -> None:
+        host_id = self._host_model.host_id(current.row()) if current.isValid() else None
+        if host_id is None:
             self._current_host = None
             self._show_tunnels_empty()
             self._show_settings_empty()
             return
-        host_id = current.data(Qt.UserRole)
         self._current_host = get_host(host_id)
         if self._current_host:
             self._load_tunnels()
@@ -361,68 +560,31 @@ class MainWindow(QMainWindow):
         )
 
     def _show_settings_empty(self) -> None:
-        self.settings_form.setVisible(False)
+        if self.settings_form is not None:
+            self.settings_form.setVisible(False)
         self.settings_empty.setVisible(True)
 
     def _load_tunnels(self) -> None:
         if not self._current_host:
             return
-        tunnels = list_tunnels(self._current_host.id)
+        rows = list_tunnels_with_latest_exit(self._current_host.id)
+        tunnels = [t for t, _ in rows]
         self.tunnels_empty.setVisible(False)
         self.tunnels_table.setVisible(True)
         self.new_tunnel_btn.setVisible(True)
-        self.tunnels_table.setRowCount(len(tunnels))
-        for row, t in enumerate(tunnels):
-            name_item = QTableWidgetItem(t.name)
-            name_item.setToolTip(t.name)
-            self.tunnels_table.setItem(row, 0, name_item)
-            type_label = {"local": "Local (-L)", "remote": "Remote (-R)", "dynamic": "Dynamic (-D)"}.get(t.type, t.type)
-            self.tunnels_table.setItem(row, 1, QTableWidgetItem(type_label))
-            endpoint = tunnel_endpoint_summary(t)
-            endpoint_item = QTableWidgetItem(endpoint)
-            endpoint_item.setToolTip(endpoint)
-            self.tunnels_table.setItem(row, 2, endpoint_item)
-            status = self._get_tunnel_status(t.id)
-            pill = StatusPill(status["text"], status["status"])
-            self.tunnels_table.setCellWidget(row, 3, pill)
-            cb = QCheckBox()
-            cb.setChecked(self._run_in_background.get(t.id, False))
-            cb.stateChanged.connect(lambda s, tid=t.id: self._set_run_in_background(tid, s == Qt.Checked))
-            self.tunnels_table.setCellWidget(row, 4, cb)
-            actions = QWidget()
-            actions_layout = QHBoxLayout(actions)
-            actions_layout.setContentsMargins(2, 2, 2, 2)
-            start_btn = QPushButton("Start")
-            start_btn.setStyleSheet(primary_button_style())
-            start_btn.clicked.connect(lambda _, tid=t.id: self._on_start_tunnel(tid))
-            stop_btn = QPushButton("Stop")
-            stop_btn.setStyleSheet(secondary_button_style())
-            stop_btn.clicked.connect(lambda _, tid=t.id: self._on_stop_tunnel(tid))
-            restart_btn = QPushButton("Restart")
-            restart_btn.setStyleSheet(secondary_button_style())
-            restart_btn.clicked.connect(lambda _, tid=t.id: self._on_restart_tunnel(tid))
-            edit_btn = QPushButton("Edit")
-            edit_btn.setStyleSheet(secondary_button_style())
-            edit_btn.clicked.connect(lambda _, tid=t.id: self._on_edit_tunnel(tid))
-            delete_btn = QPushButton("Delete")
-            delete_btn.setStyleSheet("color: #dc2626;")
-            delete_btn.clicked.connect(lambda _, tid=t.id: self._on_delete_tunnel(tid))
-            actions_layout.setSpacing(4)
-            actions_layout.setContentsMargins(4, 2, 4, 2)
-            for btn in (start_btn, stop_btn, restart_btn, edit_btn, delete_btn):
-                btn.setMinimumWidth(58)
-            actions_layout.addWidget(start_btn)
-            actions_layout.addWidget(stop_btn)
-            actions_layout.addWidget(restart_btn)
-            actions_layout.addWidget(edit_btn)
-            actions_layout.addWidget(delete_btn)
-            self.tunnels_table.setCellWidget(row, 5, actions)
-            self.tunnels_table.setItem(row, 6, QTableWidgetItem(str(t.id)))
+        with _batched_updates(self.tunnels_table):
+            self._tunnel_model.set_tunnels(tunnels, [self._get_tunnel_status(t.id, code) for t, code in rows])
         if not tunnels:
             self.tunnels_empty.setVisible(True)
             self.tunnels_empty.setText("No tunnels yet. Click 'New Tunnel' to add one.")
 
-    def _get_tunnel_status(self, tunnel_id: int) -> dict:
+    def _refresh_row(self, tunnel_id: int) -> None:
+        """Recompute one tunnel's status after a state change; the rest of the table is left alone."""
+        self._tunnel_model.set_status(tunnel_id, self._get_tunnel_status(tunnel_id))
+
+    def _get_tunnel_status(self, tunnel_id: int, latest_exit_code=_FETCH) -> dict:
+        if tunnel_id in self._starting:
+            return {"text": "Starting…", "status": "starting"}
         if tunnel_id in self._sshtunnel_runners:
             runner = self._sshtunnel_runners[tunnel_id]
             if runner.is_running():
@@ -434,21 +596,27 @@ class MainWindow(QMainWindow):
                 return {"text": f"Running (PID {pid})", "status": "running"}
         if tunnel_id in self._detached_pids:
             pid = self._detached_pids[tunnel_id]
-            if is_process_alive(pid):
+            if tunnel_id in self._pid_watchers or not reap_if_exited(pid):
                 return {"text": f"Running (PID {pid})", "status": "running"}
             return {"text": "Stopped", "status": "stopped"}
-        run = get_latest_run(tunnel_id)
-        if run and run.exit_code and run.exit_code != 0:
-            return {"text": f"Exit {run.exit_code}", "status": "error"}
+        if latest_exit_code is _FETCH:
+            run = get_latest_run(tunnel_id)
+            latest_exit_code = run.exit_code if run else None
+        if latest_exit_code:
+            return {"text": f"Exit {latest_exit_code}", "status": "error"}
         return {"text": "Stopped", "status": "stopped"}
 
-    def _set_run_in_background(self, tunnel_id: int, value: bool) -> None:
-        self._run_in_background[tunnel_id] = value
+    def _on_tab_changed(self, index: int) -> None:
+        if self.tabs.widget(index) is self.settings_tab and self.settings_form is None:
+            self._load_host_settings()
 
     def _load_host_settings(self) -> None:
         if not self._current_host:
             self._show_settings_empty()
             return
+        if self.settings_form is None and self.tabs.currentWidget() is not self.settings_tab:
+            return  # filled in by _on_tab_changed when the tab is first opened
+        self._ensure_settings_form()
         self.settings_empty.setVisible(False)
         self.settings_form.setVisible(True)
         h = self._current_host
@@ -462,15 +630,16 @@ class MainWindow(QMainWindow):
         self.settings_keepalive_count.setValue(h.keepalive_countmax or 3)
 
     def _on_new_host(self) -> None:
+        from .dialogs import HostEditDialog
+
         dlg = HostEditDialog(parent=self)
         if dlg.exec():
             h = dlg.get_host()
             h.id = insert_host(h)
             self._load_hosts()
-            for i in range(self.host_list.count()):
-                if self.host_list.item(i).data(Qt.UserRole) == h.id:
-                    self.host_list.setCurrentRow(i)
-                    break
+            row = self._host_model.row_of(h.id)
+            if row is not None:
+                self.host_list.setCurrentIndex(self._host_model.index(row))
 
     def _on_save_host(self) -> None:
         if not self._current_host:
@@ -506,6 +675,8 @@ class MainWindow(QMainWindow):
     def _on_new_tunnel(self) -> None:
         if not self._current_host:
             return
+        from .dialogs import TunnelEditDialog
+
         t = Tunnel.default_local(self._current_host.id)
         dlg = TunnelEditDialog(t, parent=self)
         if dlg.exec():
@@ -513,126 +684,172 @@ class MainWindow(QMainWindow):
             t.id = insert_tunnel(t)
             self._load_tunnels()
 
-    def _on_start_tunnel(self, tunnel_id: int) -> None:
-        tunnel = get_tunnel(tunnel_id)
-        host = get_host(tunnel.host_id) if tunnel else None
-        if not tunnel or not host:
-            return
-        dlg = PasswordDialog(host.name, tunnel.name, self)
+    def _ask_password(self, host: Host, tunnel_name: str) -> Optional[str]:
+        dlg = PasswordDialog(host.name, tunnel_name, self)
         if not dlg.exec():
-            return
+            return None
         password = dlg.get_password()
         if not password:
             QMessageBox.warning(self, "Password Required", "Please enter the SSH password.")
+            return None
+        return password
+
+    def _on_start_tunnel(self, tunnel_id: int) -> None:
+        tunnel = get_tunnel(tunnel_id)
+        host = get_host(tunnel.host_id) if tunnel else None
+        if not tunnel or not host or tunnel_id in self._starting:
+            return
+        password = self._ask_password(host, tunnel.name)
+        if password:
+            self._start_tunnel_with_data(host, tunnel, password)
+
+    def _uses_qprocess(self, tunnel: Tunnel) -> bool:
+        """True if the tunnel runs as a managed ssh QProcess (neither sshtunnel nor detached)."""
+        return tunnel.type != "local" and not self._run_in_background.get(tunnel.id, False)
+
+    def _start_tunnel_with_data(self, host: Host, tunnel: Tunnel, password: str, run_id: Optional[int] = None) -> None:
+        """Start a tunnel from already-loaded rows. A managed QProcess start uses run_id if given."""
+        tunnel_id = tunnel.id
+        if tunnel_id in self._starting:
             return
         run_in_bg = self._run_in_background.get(tunnel_id, False)
-        if (tunnel.type != "local" or run_in_bg) and not find_ssh():
-            show_setup_message(self)
+        if (tunnel.type != "local" or run_in_bg) and not self._require_ssh():
             return
 
         if tunnel.type == "local" and not run_in_bg:
             self._start_local_tunnel_sshtunnel(tunnel_id, host, tunnel, password)
         elif run_in_bg:
-            pid, log_path, err = start_detached(tunnel_id, host, tunnel, password)
-            if err:
-                QMessageBox.warning(self, "Start Failed", err)
-                return
-            run = Run(
-                id=None,
-                tunnel_id=tunnel_id,
-                started_at=datetime.utcnow().isoformat() + "Z",
-                stopped_at=None,
-                pid=pid,
-                mode="detached",
-                exit_code=None,
-                log_path=str(log_path) if log_path else None,
-                last_error=None,
-            )
-            insert_run(run)
-            self._detached_pids[tunnel_id] = pid
-            if log_path:
-                self._log_paths[tunnel_id] = log_path
-            self._load_tunnels()
-            QTimer.singleShot(10000, _delete_password_file)
-            QTimer.singleShot(2500, lambda: self._verify_tunnel_started(tunnel_id, pid, True))
+            self._starting.add(tunnel_id)
+            self._pending_launches[tunnel_id] = self._launcher.launch(tunnel_id, host, tunnel, password)
+            self._refresh_row(tunnel_id)
         else:
-            run = Run(
-                id=None,
-                tunnel_id=tunnel_id,
-                started_at=datetime.utcnow().isoformat() + "Z",
-                stopped_at=None,
-                pid=None,
-                mode="managed",
-                exit_code=None,
-                log_path=None,
-                last_error=None,
-            )
-            run_id = insert_run(run)
+            if run_id is None:
+                run_id = insert_run(_new_managed_run(tunnel_id))
             proc = ManagedTunnelProcess(tunnel_id, host, tunnel, run_id, self)
-            proc.log_line.connect(lambda line: self._append_log(tunnel_id, line))
+            proc.log_lines.connect(lambda lines: self._append_log(tunnel_id, lines))
+            proc.started_signal.connect(self._on_managed_started)
             proc.finished_signal.connect(self._on_managed_finished)
             self._managed_processes[tunnel_id] = proc
             log_path = _log_path_for_tunnel(tunnel_id)
             self._log_paths[tunnel_id] = log_path
+            self._starting.add(tunnel_id)
+            # Reset before start(): a launch that fails inside it logs the error right away
+            self._reset_log_view(tunnel_id)
             if proc.start(password):
-                self.log_viewer.clear()
-                self._selected_log_tunnel = tunnel_id
+                if self._managed_processes.get(tunnel_id) is not proc:
+                    return  # failed inside start(); _on_managed_finished has cleaned up
                 if proc.log_path:
                     self._log_paths[tunnel_id] = proc.log_path
                     update_run_log_path(run_id, str(proc.log_path))
-                self._load_tunnels()
+                self._refresh_row(tunnel_id)
                 QTimer.singleShot(2500, lambda: self._verify_tunnel_started(tunnel_id, None, False))
             else:
+                self._starting.discard(tunnel_id)
                 self._managed_processes.pop(tunnel_id, None)
 
-    def _start_local_tunnel_sshtunnel(self, tunnel_id: int, host, tunnel, password: str) -> None:
-        """Start Local (-L) tunnel using sshtunnel (supports password auth)."""
+    def _on_managed_started(self, tunnel_id: int) -> None:
+        self._starting.discard(tunnel_id)
+        if tunnel_id in self._cancel_on_start:
+            self._cancel_on_start.discard(tunnel_id)
+            self._managed_processes[tunnel_id].stop()  # finished_signal does the cleanup
+            return
+        self._refresh_row(tunnel_id)
+
+    def _on_detached_launched(self, tunnel_id: int, result: tuple) -> None:
+        if self._pending_launches.pop(tunnel_id, None) is None:
+            return  # already dealt with on exit
+        pid, log_path, err = result
+        self._starting.discard(tunnel_id)
+        cancelled = tunnel_id in self._cancel_on_start
+        self._cancel_on_start.discard(tunnel_id)
+        if err:
+            self._refresh_row(tunnel_id)
+            if not cancelled:
+                QMessageBox.warning(self, "Start Failed", err)
+            return
+        if cancelled:
+            if kill_process_tree(pid):
+                reap_if_exited(pid, block=True)
+            self._refresh_row(tunnel_id)
+            return
         run = Run(
             id=None,
             tunnel_id=tunnel_id,
-            started_at=datetime.utcnow().isoformat() + "Z",
+            started_at=int(time.time()),
             stopped_at=None,
-            pid=None,
-            mode="managed",
+            pid=pid,
+            mode="detached",
             exit_code=None,
-            log_path=None,
+            log_path=str(log_path) if log_path else None,
             last_error=None,
         )
-        run_id = insert_run(run)
+        submit_run(run)
+        self._detached_pids[tunnel_id] = pid
+        self._watch_detached(tunnel_id, pid)
+        if log_path:
+            self._log_paths[tunnel_id] = log_path
+        self._refresh_row(tunnel_id)
+        QTimer.singleShot(2500, lambda: self._verify_tunnel_started(tunnel_id, pid, True))
+
+    def _watch_detached(self, tunnel_id: int, pid: int) -> None:
+        """Get notified when a detached pid exits instead of polling it, where pidfds exist."""
+        fd = open_exit_fd(pid)
+        if fd is None:
+            return
+        notifier = QSocketNotifier(fd, QSocketNotifier.Read, self)
+        notifier.activated.connect(lambda *_: self._on_detached_exited(tunnel_id))
+        self._pid_watchers[tunnel_id] = notifier
+
+    def _forget_detached(self, tunnel_id: int) -> None:
+        self._detached_pids.pop(tunnel_id, None)
+        notifier = self._pid_watchers.pop(tunnel_id, None)
+        if notifier is not None:
+            notifier.setEnabled(False)
+            os.close(notifier.socket())
+            notifier.deleteLater()
+
+    def _on_detached_exited(self, tunnel_id: int) -> None:
+        if tunnel_id not in self._pid_watchers:
+            return
+        reap_if_exited(self._detached_pids[tunnel_id])  # don't leave a zombie behind
+        self._forget_detached(tunnel_id)
+        update_latest_run_stopped(tunnel_id, int(time.time()), None)
+        self._refresh_row(tunnel_id)
+
+    def _start_local_tunnel_sshtunnel(self, tunnel_id: int, host, tunnel, password: str) -> None:
+        """Start Local (-L) tunnel using sshtunnel (supports password auth)."""
+        submit_run(_new_managed_run(tunnel_id))
+        self._log_paths.pop(tunnel_id, None)  # sshtunnel runs have no log file
         runner = SSHTunnelRunner(tunnel_id, host, tunnel, self)
-        runner.log_line.connect(lambda line: self._append_log(tunnel_id, line))
+        runner.log_lines.connect(lambda lines: self._append_log(tunnel_id, lines))
         runner.started_signal.connect(self._on_sshtunnel_started)
         runner.finished_signal.connect(self._on_sshtunnel_finished)
         self._sshtunnel_runners[tunnel_id] = runner
-        self.log_viewer.clear()
-        self._selected_log_tunnel = tunnel_id
+        self._reset_log_view(tunnel_id)
         if runner.start(password):
-            self._load_tunnels()
+            self._refresh_row(tunnel_id)
         else:
             self._sshtunnel_runners.pop(tunnel_id, None)
 
     def _on_sshtunnel_started(self, tunnel_id: int) -> None:
         """Refresh table when sshtunnel actually starts (status was 'Stopped' until now)."""
-        self._load_tunnels()
+        self._refresh_row(tunnel_id)
 
     def _on_sshtunnel_finished(self, tunnel_id: int, exit_code: int) -> None:
         runner = self._sshtunnel_runners.pop(tunnel_id, None)
-        run = get_latest_run(tunnel_id)
-        if run:
-            update_run_stopped(run.id, datetime.utcnow().isoformat() + "Z", exit_code)
-        self._load_tunnels()
+        update_latest_run_stopped(tunnel_id, int(time.time()), exit_code)
+        self._refresh_row(tunnel_id)
         if exit_code != 0:
-            self.log_viewer.append(f"[Tunnel exited with code {exit_code}]")
+            self._flush_log()
+            self._show_log_lines([f"[Tunnel exited with code {exit_code}]"])
 
     def _verify_tunnel_started(self, tunnel_id: int, detached_pid: Optional[int], is_detached: bool) -> None:
         """Verify tunnel is still running ~2.5s after start; if it died, likely auth/connection failure."""
         if is_detached and detached_pid:
-            if not is_process_alive(detached_pid):
-                self._detached_pids.pop(tunnel_id, None)
-                run = get_latest_run(tunnel_id)
-                if run:
-                    update_run_stopped(run.id, datetime.utcnow().isoformat() + "Z", None)
-                self._load_tunnels()
+            if reap_if_exited(detached_pid):
+                self._forget_detached(tunnel_id)
+                update_latest_run_stopped(tunnel_id, int(time.time()), None)
+                self._refresh_row(tunnel_id)
                 QMessageBox.warning(
                     self,
                     "Tunnel Stopped",
@@ -643,32 +860,38 @@ class MainWindow(QMainWindow):
             proc = self._managed_processes[tunnel_id]
             if not proc.is_running():
                 # Process already exited; finished_signal should have fired. Just refresh.
-                self._load_tunnels()
+                self._refresh_row(tunnel_id)
 
     def _on_stop_tunnel(self, tunnel_id: int) -> None:
+        if tunnel_id in self._starting:
+            # Nothing to stop until the launch reports back; stop it then
+            self._cancel_on_start.add(tunnel_id)
+            return
         if tunnel_id in self._sshtunnel_runners:
             self._sshtunnel_runners[tunnel_id].stop()
             self._sshtunnel_runners.pop(tunnel_id, None)
-            run = get_latest_run(tunnel_id)
-            if run:
-                update_run_stopped(run.id, datetime.utcnow().isoformat() + "Z", None)
-            self._load_tunnels()
+            update_latest_run_stopped(tunnel_id, int(time.time()), None)
+            self._refresh_row(tunnel_id)
         elif tunnel_id in self._managed_processes:
             self._managed_processes[tunnel_id].stop()
         elif tunnel_id in self._detached_pids:
             pid = self._detached_pids[tunnel_id]
-            kill_process_tree(pid)
-            self._detached_pids.pop(tunnel_id, None)
-            run = get_latest_run(tunnel_id)
-            if run:
-                update_run_stopped(run.id, datetime.utcnow().isoformat() + "Z", None)
-            self._load_tunnels()
+            if kill_process_tree(pid):
+                reap_if_exited(pid, block=True)  # a killed child would otherwise stay a zombie
+            self._forget_detached(tunnel_id)
+            update_latest_run_stopped(tunnel_id, int(time.time()), None)
+            self._refresh_row(tunnel_id)
+
+    def _on_tunnel_action(self, action: str, tunnel_id: int) -> None:
+        getattr(self, self._TUNNEL_ACTIONS[action])(tunnel_id)
 
     def _on_restart_tunnel(self, tunnel_id: int) -> None:
         self._on_stop_tunnel(tunnel_id)
         QTimer.singleShot(500, lambda: self._on_start_tunnel(tunnel_id))
 
     def _on_edit_tunnel(self, tunnel_id: int) -> None:
+        from .dialogs import TunnelEditDialog
+
         tunnel = get_tunnel(tunnel_id)
         if not tunnel:
             return
@@ -691,16 +914,36 @@ class MainWindow(QMainWindow):
         ) == QMessageBox.Yes:
             self._on_stop_tunnel(tunnel_id)
             delete_tunnel(tunnel_id)
+            self._log_paths.pop(tunnel_id, None)
             self._load_tunnels()
 
+    def _require_ssh(self) -> bool:
+        """True if ssh.exe was found; otherwise explain how to install it."""
+        if find_ssh():
+            return True
+        # find_ssh caches its answer; drop the miss so a retry after installing OpenSSH finds it
+        find_ssh.cache_clear()
+        show_setup_message(self)
+        return False
+
     def _on_start_all(self) -> None:
-        if not find_ssh():
-            show_setup_message(self)
+        if not self._require_ssh():
             return
-        if not self._current_host:
+        host = self._current_host
+        if not host:
             return
-        for t in list_tunnels(self._current_host.id):
-            self._on_start_tunnel(t.id)
+        tunnels = [t for t in list_tunnels(host.id) if t.id not in self._starting]
+        if not tunnels:
+            return
+        # Every tunnel here goes through the same host, so one password covers them all
+        password = self._ask_password(host, "all tunnels")
+        if not password:
+            return
+        # Managed runs need their ids before the spawn; insert them together in one write
+        managed = [t for t in tunnels if self._uses_qprocess(t)]
+        run_ids = dict(zip((t.id for t in managed), insert_runs([_new_managed_run(t.id) for t in managed])))
+        for t in tunnels:
+            self._start_tunnel_with_data(host, t, password, run_ids.get(t.id))
 
     def _on_stop_all(self) -> None:
         if not self._current_host:
@@ -708,90 +951,193 @@ class MainWindow(QMainWindow):
         for t in list_tunnels(self._current_host.id):
             self._on_stop_tunnel(t.id)
 
-    def _append_log(self, tunnel_id: int, line: str) -> None:
-        if getattr(self, "_selected_log_tunnel", None) == tunnel_id:
-            self.log_viewer.append(line)
+    def _append_log(self, tunnel_id: int, lines: list[str]) -> None:
+        """Queue lines for the log viewer; they are appended together on the next flush."""
+        if getattr(self, "_selected_log_tunnel", None) != tunnel_id:
+            return
+        self._log_pending.extend((tunnel_id, line) for line in lines)
+        if not self._log_flush_timer.isActive():
+            self._log_flush_timer.start()
+
+    def _flush_log(self) -> None:
+        self._log_flush_timer.stop()
+        # Lines queued for a tunnel that is no longer selected are dropped, as before
+        tid = self._selected_log_tunnel
+        lines = [line for t, line in self._log_pending if t == tid]
+        self._log_pending.clear()
+        if lines:
+            self._show_log_lines(lines)
+
+    def _show_log_lines(self, lines: list[str]) -> None:
+        if self._log_loading:
+            # The file read would replace them; _on_log_loaded appends them after it
+            self._log_held.extend(lines)
+        else:
+            self.log_viewer.appendPlainText("\n".join(lines))
+
+    def _reset_log_view(self, tunnel_id: int) -> None:
+        """Empty the viewer for tunnel_id's output, dropping any file read still on its way."""
+        self.log_viewer.clear()
+        self._stop_log_tail()
+        self._selected_log_tunnel = tunnel_id
+        self._log_request_id += 1
+        self._log_loading = False
+        self._log_held.clear()
 
     def _on_managed_finished(self, tunnel_id: int, exit_code: int, run_id: int) -> None:
+        self._starting.discard(tunnel_id)
+        self._cancel_on_start.discard(tunnel_id)
         proc = self._managed_processes.pop(tunnel_id, None)
         if proc and proc.log_path:
             self._log_paths[tunnel_id] = proc.log_path
-        update_run_stopped(run_id, datetime.utcnow().isoformat() + "Z", exit_code)
-        self._load_tunnels()
+        update_run_stopped(run_id, int(time.time()), exit_code)
+        self._refresh_row(tunnel_id)
         if exit_code != 0:
-            self.log_viewer.append(f"[Tunnel exited with code {exit_code}]")
+            self._flush_log()
+            self._show_log_lines([f"[Tunnel exited with code {exit_code}]"])
 
     def _on_tunnel_selected(self) -> None:
-        rows = self.tunnels_table.selectedItems()
+        rows = self.tunnels_table.selectionModel().selectedRows()
         if not rows:
             return
-        row = rows[0].row()
-        tid_item = self.tunnels_table.item(row, 6)
-        if tid_item:
-            tunnel_id = int(tid_item.text())
+        tunnel_id = self._tunnel_model.tunnel_id(rows[0].row())
+        if tunnel_id is not None:
             self._selected_log_tunnel = tunnel_id
             self._show_log_for_tunnel(tunnel_id)
 
     def _show_log_for_tunnel(self, tunnel_id: int) -> None:
-        self.log_viewer.clear()
-        if tunnel_id in self._managed_processes:
-            # Live - we get lines via signal; show file if exists
-            pass
+        self._reset_log_view(tunnel_id)
+        self._log_loading = True
+        self._log_reader.read(self._log_request_id, tunnel_id, self._log_path_of(tunnel_id))
+
+    def _log_path_of(self, tunnel_id: int) -> Optional[Path]:
+        """The tunnel's current log file; a path found through its latest run is kept in _log_paths."""
         log_path = self._log_paths.get(tunnel_id)
-        if not log_path:
+        if log_path is None:
             run = get_latest_run(tunnel_id)
             if run and run.log_path:
-                log_path = Path(run.log_path)
-        if log_path and log_path.exists():
-            try:
-                self.log_viewer.setPlainText(log_path.read_text(encoding="utf-8", errors="replace"))
-            except Exception:
-                self.log_viewer.setPlainText("(Could not read log file)")
-        else:
-            self.log_viewer.setPlainText("(No log yet)")
+                log_path = self._log_paths[tunnel_id] = Path(run.log_path)
+        return log_path
+
+    def _on_log_loaded(
+        self, request_id: int, tunnel_id: int, text: str, log_path: Optional[Path], end: Optional[int]
+    ) -> None:
+        # A newer selection has been made since; its own read is on the way
+        if request_id != self._log_request_id or tunnel_id != self._selected_log_tunnel:
+            return
+        # appendPlainText starts a new block, so a trailing newline would show as a blank line
+        self.log_viewer.setPlainText(text.removesuffix("\n"))
+        held = _lines_not_in(text, self._log_held)
+        self._log_loading = False
+        self._log_held.clear()
+        if held:
+            self.log_viewer.appendPlainText("\n".join(held))
+        # Managed and sshtunnel output already arrives through log_lines
+        if end is not None and tunnel_id in self._detached_pids:
+            self._log_tail_path = log_path
+            self._log_tail_offset = end
+            self._log_tail_decoder.reset()
+            self._log_tail_rest = ""
+            self._log_watcher.addPath(str(self._log_tail_path))
+            self._on_log_file_changed(str(self._log_tail_path))  # catch up on writes since the read
+
+    def _stop_log_tail(self) -> None:
+        if self._log_tail_path is not None:
+            self._log_watcher.removePath(str(self._log_tail_path))
+            self._log_tail_path = None
+
+    def _on_log_file_changed(self, path: str) -> None:
+        """Append whatever the followed log file gained since the last read."""
+        if self._log_tail_path is None or path != str(self._log_tail_path):
+            return
+        lines: list[str] = []
+        try:
+            with open(path, "rb") as f:
+                if f.seek(0, os.SEEK_END) < self._log_tail_offset:
+                    # Truncated or replaced; start over
+                    self._log_tail_offset = 0
+                    self._log_tail_decoder.reset()
+                    self._log_tail_rest = ""
+                f.seek(self._log_tail_offset)
+                # Decode chunk by chunk; a split character or line carries over to the next chunk
+                while chunk := f.read(LOG_READ_CHUNK_BYTES):
+                    self._log_tail_offset += len(chunk)
+                    *complete, self._log_tail_rest = (
+                        self._log_tail_rest + self._log_tail_decoder.decode(chunk)
+                    ).split("\n")
+                    lines.extend(complete)
+        except OSError:
+            pass
+        if path not in self._log_watcher.files():
+            self._log_watcher.addPath(path)  # replaced files drop out of the watcher
+        if lines:
+            self.log_viewer.appendPlainText("\n".join(lines))
 
     def _on_copy_logs(self) -> None:
         text = self.log_viewer.toPlainText()
         if text:
-            from PySide6.QtWidgets import QApplication
             QApplication.clipboard().setText(text)
 
     def _on_open_log_file(self) -> None:
         tid = getattr(self, "_selected_log_tunnel", None)
         if not tid:
             return
-        log_path = self._log_paths.get(tid)
-        if not log_path:
-            run = get_latest_run(tid)
-            if run and run.log_path:
-                log_path = Path(run.log_path)
+        log_path = self._log_path_of(tid)
         if log_path and log_path.exists():
-            if sys.platform == "win32":
-                os.startfile(str(log_path))
-            else:
-                subprocess.run(["xdg-open", str(log_path)], check=False)
+            # Hands off to the platform's file opener without blocking on it
+            QDesktopServices.openUrl(QUrl.fromLocalFile(str(log_path)))
 
     def _detect_running_tunnels(self) -> None:
-        """On startup, check for detached PIDs we might have started."""
-        pass
+        """On startup, re-adopt detached tunnels from an earlier session whose ssh is still running."""
+        now = int(time.time())
+        for run in list_open_detached_runs():
+            if not is_ssh_process(run.pid):
+                update_run_stopped(run.id, now, None)
+                continue
+            self._detached_pids[run.tunnel_id] = run.pid
+            if run.log_path:
+                self._log_paths[run.tunnel_id] = Path(run.log_path)
+            self._watch_detached(run.tunnel_id, run.pid)
 
     def _refresh_tunnel_statuses(self) -> None:
-        """Periodically verify tunnel status; refresh table if any detached died or sshtunnel started."""
+        """Periodically verify tunnel status; repaint only the rows whose status changed."""
         if not self._current_host:
             return
-        changed = False
-        if self._sshtunnel_runners:
-            changed = True
-        for tid in list(self._detached_pids.keys()):
-            pid = self._detached_pids[tid]
-            if not is_process_alive(pid):
-                self._detached_pids.pop(tid, None)
-                run = get_latest_run(tid)
-                if run:
-                    update_run_stopped(run.id, datetime.utcnow().isoformat() + "Z", None)
-                changed = True
-        if changed:
-            self._load_tunnels()
+        # Only tunnels we are tracking can change state between refreshes
+        tids = set(self._managed_processes) | set(self._sshtunnel_runners) | set(self._detached_pids)
+        for tid in self._drain_dead_pids():
+            self._forget_detached(tid)
+            update_latest_run_stopped(tid, int(time.time()), None)
+        for tid in tids:
+            self._tunnel_model.set_status(tid, self._get_tunnel_status(tid))
+
+    def _drain_dead_pids(self) -> list[int]:
+        """Tunnel ids of unwatched detached pids that have exited (reaping our own children)."""
+        return [
+            tid for tid, pid in self._detached_pids.items() if tid not in self._pid_watchers and reap_if_exited(pid)
+        ]
+
+    def _update_status_timer(self) -> None:
+        """Poll statuses only while the tunnels table can be seen; catch up when it reappears."""
+        visible = self.isVisible() and not self.isMinimized() and self.tabs.currentWidget() is self.tunnels_tab
+        if not visible:
+            self._status_timer.stop()
+        elif not self._status_timer.isActive():
+            self._status_timer.start()
+            self._refresh_tunnel_statuses()
+
+    def showEvent(self, event) -> None:
+        super().showEvent(event)
+        self._update_status_timer()
+
+    def hideEvent(self, event) -> None:
+        super().hideEvent(event)
+        self._update_status_timer()
+
+    def changeEvent(self, event) -> None:
+        super().changeEvent(event)
+        if event.type() == QEvent.WindowStateChange:
+            self._update_status_timer()
 
     def _on_quit_from_tray(self) -> None:
         result = self._handle_close_request()
@@ -815,28 +1161,43 @@ class MainWindow(QMainWindow):
         else:
             event.accept()
 
+    def _stop_all_tunnels(self) -> None:
+        """Stop every tunnel for exit; the waits for ssh to go away overlap instead of adding up."""
+        for tid in list(self._sshtunnel_runners.keys()):
+            self._on_stop_tunnel(tid)  # already asynchronous
+        stop_managed(list(self._managed_processes.values()))
+        detached = dict(self._detached_pids)
+        # Launches still in flight would leave an untracked ssh behind; wait for them and kill it too
+        launched = []
+        for tid, fut in self._pending_launches.items():
+            self._starting.discard(tid)
+            pid, _, err = fut.result()
+            if not err:
+                launched.append(pid)
+        self._pending_launches.clear()
+        pids = list(detached.values()) + launched
+        for pid, killed in zip(pids, kill_process_trees(pids)):
+            if killed:
+                reap_if_exited(pid, block=True)
+        now = int(time.time())
+        for tid in detached:
+            self._forget_detached(tid)
+            update_latest_run_stopped(tid, now, None)
+
     def _handle_close_request(self) -> str:
         """Returns 'exit'|'tray'|'cancel'."""
         has_managed = bool(self._managed_processes)
-        has_detached = bool(self._detached_pids)
+        has_detached = bool(self._detached_pids or self._pending_launches)
         if not has_managed and not has_detached:
             return "exit"
+        from .dialogs import CloseConfirmDialog
+
         dlg = CloseConfirmDialog(has_detached, self)
         dlg.setWindowModality(Qt.ApplicationModal)
         ret = dlg.exec()
         if ret == 1:  # Exit
-            for tid in list(self._sshtunnel_runners.keys()):
-                self._on_stop_tunnel(tid)
-            for tid in list(self._managed_processes.keys()):
-                self._on_stop_tunnel(tid)
-            for tid in list(self._detached_pids.keys()):
-                self._on_stop_tunnel(tid)
+            self._stop_all_tunnels()
             return "exit"
         if ret == 2:  # Tray
             return "tray"
         return "cancel"
-
-
-def _log_path_for_tunnel(tunnel_id: int) -> Path:
-    from ..core.process_manager import _log_path_for_tunnel as _p
-    return _p(tunnel_id)
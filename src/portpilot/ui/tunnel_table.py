@@ -0,0 +1,224 @@
+"""Tunnels table for the Tunnels tab: a lazy model plus painted delegates."""
+
+from typing import Any, Callable, Optional
+
+from PySide6.QtCore import QAbstractTableModel, QEvent, QModelIndex, QRect, Qt, Signal
+from PySide6.QtGui import QColor, QFont, QFontMetrics, QPainter
+from PySide6.QtWidgets import QApplication, QStyle, QStyledItemDelegate, QStyleOptionViewItem
+
+from ..core.models import Tunnel
+from .widgets import STATUS_COLORS
+
+COLUMNS = ("Name", "Type", "Endpoint", "Status", "Background", "Actions")
+COL_NAME, COL_TYPE, COL_ENDPOINT, COL_STATUS, COL_BACKGROUND, COL_ACTIONS = range(len(COLUMNS))
+
+# Status column: the status key ("running"/"stopped"/"error") next to its DisplayRole text
+STATUS_ROLE = Qt.UserRole + 1
+
+_TYPE_LABELS = {"local": "Local (-L)", "remote": "Remote (-R)", "dynamic": "Dynamic (-D)"}
+
+# status -> (foreground, background) QColors for the pill, parsed once instead of per paint
+_PILL_COLORS = {status: (QColor(fg), QColor(bg)) for status, (fg, bg) in STATUS_COLORS.items()}
+_PILL_DEFAULT = _PILL_COLORS["stopped"]
+
+
+# tunnel type -> endpoint summary formatter
+_ENDPOINT_FORMATS: dict[str, Callable[[Tunnel], str]] = {
+    "local": lambda t: f"localhost:{t.local_port} → {t.remote_host}:{t.remote_port}",
+    "remote": lambda t: f"remote:{t.remote_port} ← {t.remote_host}:{t.local_port}",
+    "dynamic": lambda t: f"SOCKS5 localhost:{t.socks_port}",
+}
+
+
+def tunnel_endpoint_summary(t: Tunnel) -> str:
+    """Human-readable endpoint summary for tunnel table."""
+    fmt = _ENDPOINT_FORMATS.get(t.type)
+    return fmt(t) if fmt else ""
+
+
+class TunnelTableModel(QAbstractTableModel):
+    """One host's tunnels and their cached status dicts; cells are built on demand in data()."""
+
+    def __init__(self, background: dict[int, bool], parent=None):
+        super().__init__(parent)
+        self._tunnels: list[Tunnel] = []
+        self._statuses: list[dict] = []
+        self._row_by_tid: dict[int, int] = {}
+        # row -> endpoint summary, filled in by data() as rows are painted
+        self._endpoints: dict[int, str] = {}
+        # tunnel_id -> run-in-background toggle, shared with the owner
+        self._background = background
+
+    def set_tunnels(self, tunnels: list[Tunnel], statuses: list[dict]) -> None:
+        self.beginResetModel()
+        self._tunnels = tunnels
+        self._statuses = statuses
+        self._row_by_tid = {t.id: row for row, t in enumerate(tunnels)}
+        self._endpoints.clear()
+        self.endResetModel()
+
+    def set_status(self, tunnel_id: int, status: dict) -> bool:
+        """Update one tunnel's status, repainting its status and action cells only if it changed."""
+        row = self._row_by_tid.get(tunnel_id)
+        if row is None or self._statuses[row] == status:
+            return False
+        self._statuses[row] = status
+        self.dataChanged.emit(self.index(row, COL_STATUS), self.index(row, COL_ACTIONS), [Qt.DisplayRole, STATUS_ROLE])
+        return True
+
+    def tunnel_id(self, row: int) -> Optional[int]:
+        if 0 <= row < len(self._tunnels):
+            return self._tunnels[row].id
+        return None
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._tunnels)
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(COLUMNS)
+
+    def headerData(self, section: int, orientation: Qt.Orientation, role: int = Qt.DisplayRole) -> Any:
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return COLUMNS[section]
+        return None
+
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole) -> Any:
+        if not index.isValid():
+            return None
+        t = self._tunnels[index.row()]
+        col = index.column()
+        if role == Qt.UserRole:
+            return t.id
+        if col == COL_STATUS:
+            status = self._statuses[index.row()]
+            if role == Qt.DisplayRole:
+                return status["text"]
+            if role == STATUS_ROLE:
+                return status["status"]
+            return None
+        if col == COL_BACKGROUND:
+            if role == Qt.CheckStateRole:
+                return Qt.Checked if self._background.get(t.id, False) else Qt.Unchecked
+            return None
+        if role in (Qt.DisplayRole, Qt.ToolTipRole):
+            if col == COL_NAME:
+                return t.name
+            if col == COL_ENDPOINT:
+                endpoint = self._endpoints.get(index.row())
+                if endpoint is None:
+                    endpoint = self._endpoints[index.row()] = tunnel_endpoint_summary(t)
+                return endpoint
+            if col == COL_TYPE and role == Qt.DisplayRole:
+                return _TYPE_LABELS.get(t.type, t.type)
+        return None
+
+    def flags(self, index: QModelIndex) -> Qt.ItemFlags:
+        flags = super().flags(index)
+        if index.isValid() and index.column() == COL_BACKGROUND:
+            flags |= Qt.ItemIsUserCheckable
+        return flags
+
+    def setData(self, index: QModelIndex, value: Any, role: int = Qt.EditRole) -> bool:
+        if not index.isValid() or index.column() != COL_BACKGROUND or role != Qt.CheckStateRole:
+            return False
+        self._background[self._tunnels[index.row()].id] = Qt.CheckState(value) == Qt.Checked
+        self.dataChanged.emit(index, index, [Qt.CheckStateRole])
+        return True
+
+
+def _draw_item_background(painter: QPainter, option: QStyleOptionViewItem, index: QModelIndex, delegate) -> QStyleOptionViewItem:
+    """Draw the cell's selection/hover background without its text; returns the filled option."""
+    opt = QStyleOptionViewItem(option)
+    delegate.initStyleOption(opt, index)
+    opt.text = ""
+    style = opt.widget.style() if opt.widget else QApplication.style()
+    style.drawControl(QStyle.CE_ItemViewItem, opt, painter, opt.widget)
+    return opt
+
+
+class StatusPillDelegate(QStyledItemDelegate):
+    """Paints the status column as a colored pill."""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._font: Optional[QFont] = None
+
+    def paint(self, painter: QPainter, option: QStyleOptionViewItem, index: QModelIndex) -> None:
+        _draw_item_background(painter, option, index, self)
+        text = index.data(Qt.DisplayRole) or ""
+        fg, bg = _PILL_COLORS.get(index.data(STATUS_ROLE), _PILL_DEFAULT)
+        if self._font is None:
+            self._font = QFont(option.font)
+            self._font.setPixelSize(11)
+            self._font.setWeight(QFont.Weight.Medium)
+        fm = QFontMetrics(self._font)
+        h = fm.height() + 4
+        w = min(fm.horizontalAdvance(text) + 20, option.rect.width() - 8)
+        pill = QRect(option.rect.x() + 4, option.rect.center().y() - h // 2, w, h)
+        painter.save()
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.setPen(Qt.NoPen)
+        painter.setBrush(bg)
+        painter.drawRoundedRect(pill, h / 2, h / 2)
+        painter.setFont(self._font)
+        painter.setPen(fg)
+        painter.drawText(pill, Qt.AlignCenter, fm.elidedText(text, Qt.ElideRight, max(w - 20, 0)))
+        painter.restore()
+
+
+class TunnelActionsDelegate(QStyledItemDelegate):
+    """Paints a row's action buttons and reports clicks as action_triggered(action, tunnel_id)."""
+
+    action_triggered = Signal(str, int)
+
+    # (action, label, background, foreground, border)
+    _BUTTONS = (
+        ("start", "Start", "#2563eb", "#ffffff", None),
+        ("stop", "Stop", "#e2e8f0", "#334155", "#cbd5e1"),
+        ("restart", "Restart", "#e2e8f0", "#334155", "#cbd5e1"),
+        ("edit", "Edit", "#e2e8f0", "#334155", "#cbd5e1"),
+        ("delete", "Delete", "#f8fafc", "#dc2626", "#cbd5e1"),
+    )
+    _MARGIN = 4
+    _SPACING = 4
+    _MAX_HEIGHT = 30
+    # Actions unavailable while the row's tunnel is still starting
+    _BLOCKED_WHILE_STARTING = frozenset(("start", "stop", "restart"))
+
+    @staticmethod
+    def _is_starting(index: QModelIndex) -> bool:
+        return index.siblingAtColumn(COL_STATUS).data(STATUS_ROLE) == "starting"
+
+    def _button_rects(self, rect: QRect) -> list[QRect]:
+        n = len(self._BUTTONS)
+        w = (rect.width() - 2 * self._MARGIN - (n - 1) * self._SPACING) // n
+        h = min(rect.height() - 2 * self._MARGIN, self._MAX_HEIGHT)
+        top = rect.center().y() - h // 2
+        left = rect.x() + self._MARGIN
+        return [QRect(left + i * (w + self._SPACING), top, w, h) for i in range(n)]
+
+    def paint(self, painter: QPainter, option: QStyleOptionViewItem, index: QModelIndex) -> None:
+        opt = _draw_item_background(painter, option, index, self)
+        blocked = self._BLOCKED_WHILE_STARTING if self._is_starting(index) else ()
+        painter.save()
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.setFont(opt.font)
+        for (action, label, bg, fg, border), r in zip(self._BUTTONS, self._button_rects(option.rect)):
+            painter.setOpacity(0.4 if action in blocked else 1.0)
+            painter.setPen(QColor(border) if border else Qt.NoPen)
+            painter.setBrush(QColor(bg))
+            painter.drawRoundedRect(r, 4, 4)
+            painter.setPen(QColor(fg))
+            painter.drawText(r, Qt.AlignCenter, label)
+        painter.restore()
+
+    def editorEvent(self, event: QEvent, model, option: QStyleOptionViewItem, index: QModelIndex) -> bool:
+        if event.type() != QEvent.MouseButtonRelease or event.button() != Qt.LeftButton:
+            return False
+        pos = event.position().toPoint()
+        for (action, *_), r in zip(self._BUTTONS, self._button_rects(option.rect)):
+            if r.contains(pos):
+                if not (action in self._BLOCKED_WHILE_STARTING and self._is_starting(index)):
+                    self.action_triggered.emit(action, index.data(Qt.UserRole))
+                return True
+        return False
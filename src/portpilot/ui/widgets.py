@@ -1,5 +1,6 @@
 """Reusable UI widgets for PortPilot."""
 
+import functools
 from typing import Optional
 
 from PySide6.QtCore import Qt, Signal
@@ -9,9 +10,9 @@ from PySide6.QtWidgets import (
     QLabel,
     QLineEdit,
     QMessageBox,
+    QPlainTextEdit,
     QPushButton,
     QSpinBox,
-    QTextEdit,
     QWidget,
 )
 
@@ -22,11 +23,26 @@ FONT_SIZE = 10
 SPACING = 8
 MARGIN = 12
 
+# Oldest lines are dropped from the log viewer beyond this many
+LOG_MAX_LINES = 5000
+
+# status -> (foreground, background) for status pills
+STATUS_COLORS = {
+    "running": ("#059669", "#ecfdf5"),
+    "stopped": ("#64748b", "#f1f5f9"),
+    "starting": ("#2563eb", "#eff6ff"),
+    "error": ("#dc2626", "#fef2f2"),
+}
+
+
+@functools.lru_cache(maxsize=1)
+def _base_font() -> QFont:
+    return QFont(FONT_FAMILY, FONT_SIZE)
+
 
 def apply_base_style(widget: QWidget) -> None:
-    """Apply consistent base font."""
-    font = QFont(FONT_FAMILY, FONT_SIZE)
-    widget.setFont(font)
+    """Apply consistent base font. The QFont is built once and shared."""
+    widget.setFont(_base_font())
 
 
 def primary_button_style() -> str:
@@ -96,32 +112,16 @@ def danger_button_style() -> str:
     """
 
 
-class StatusPill(QLabel):
-    """Colored status pill: Running (green), Stopped (gray), Error (red)."""
-
-    def __init__(self, text: str = "Stopped", status: str = "stopped", parent: Optional[QWidget] = None):
-        super().__init__(parent)
-        apply_base_style(self)
-        self.set_status(text, status)
-
-    def set_status(self, text: str, status: str = "stopped") -> None:
-        self.setText(text)
-        colors = {
-            "running": ("#059669", "#ecfdf5"),
-            "stopped": ("#64748b", "#f1f5f9"),
-            "error": ("#dc2626", "#fef2f2"),
-        }
-        fg, bg = colors.get(status, colors["stopped"])
-        self.setStyleSheet(f"""
-            StatusPill {{
-                background-color: {bg};
-                color: {fg};
-                border-radius: 12px;
-                padding: 2px 10px;
-                font-size: 11px;
-                font-weight: 500;
-            }}
-        """)
+def app_stylesheet() -> str:
+    """Application-wide QSS; buttons pick a style via setObjectName("primary"/"secondary"/"danger")."""
+    return "".join(
+        style().replace("QPushButton", f"QPushButton#{name}")
+        for name, style in (
+            ("primary", primary_button_style),
+            ("secondary", secondary_button_style),
+            ("danger", danger_button_style),
+        )
+    )
 
 
 class ErrorLabel(QLabel):
@@ -146,40 +146,35 @@ class ErrorLabel(QLabel):
 class StyledLineEdit(QLineEdit):
     """Consistent line edit with optional error state."""
 
+    _STYLE = """
+        QLineEdit {
+            padding: 6px 8px;
+            border: 1px solid #cbd5e1;
+            border-radius: 4px;
+            background: white;
+        }
+        QLineEdit:focus {
+            border-color: #2563eb;
+        }
+        QLineEdit:disabled {
+            background: #f8fafc;
+            color: #64748b;
+        }
+    """
+    _ERROR_STYLE = _STYLE.replace("border: 1px solid #cbd5e1", "border: 1px solid #dc2626")
+
     def __init__(self, parent: Optional[QWidget] = None):
         super().__init__(parent)
         apply_base_style(self)
-        self.setStyleSheet("""
-            QLineEdit {
-                padding: 6px 8px;
-                border: 1px solid #cbd5e1;
-                border-radius: 4px;
-                background: white;
-            }
-            QLineEdit:focus {
-                border-color: #2563eb;
-            }
-            QLineEdit:disabled {
-                background: #f8fafc;
-                color: #64748b;
-            }
-        """)
+        self._has_error = False
+        self.setStyleSheet(self._STYLE)
 
     def set_error(self, has_error: bool) -> None:
-        if has_error:
-            self.setStyleSheet(self.styleSheet().replace("border: 1px solid #cbd5e1", "border: 1px solid #dc2626"))
-        else:
-            self.setStyleSheet("""
-                QLineEdit {
-                    padding: 6px 8px;
-                    border: 1px solid #cbd5e1;
-                    border-radius: 4px;
-                    background: white;
-                }
-                QLineEdit:focus {
-                    border-color: #2563eb;
-                }
-            """)
+        """Switch the error border; the stylesheet is only re-applied when the state changes."""
+        if has_error == self._has_error:
+            return
+        self._has_error = has_error
+        self.setStyleSheet(self._ERROR_STYLE if has_error else self._STYLE)
 
 
 class StyledSpinBox(QSpinBox):
@@ -203,16 +198,23 @@ class StyledSpinBox(QSpinBox):
         """)
 
 
-class LogViewer(QTextEdit):
-    """Read-only log viewer with monospace font."""
+class LogViewer(QPlainTextEdit):
+    """Read-only plain-text log viewer with monospace font."""
 
     def __init__(self, parent: Optional[QWidget] = None):
         super().__init__(parent)
         font = QFont("Consolas", 9)
         self.setFont(font)
         self.setReadOnly(True)
+        self.setMaximumBlockCount(LOG_MAX_LINES)
+        self.setCenterOnScroll(True)
+        # Programmatic appends would otherwise pile up on the undo stack
+        self.setUndoRedoEnabled(False)
+        # Long lines scroll instead of wrapping, so a resize doesn't re-layout every block
+        self.setLineWrapMode(QPlainTextEdit.NoWrap)
+        self.document().setDocumentMargin(0)
         self.setStyleSheet("""
-            QTextEdit {
+            QPlainTextEdit {
                 background-color: #1e293b;
                 color: #e2e8f0;
                 border: 1px solid #334155;
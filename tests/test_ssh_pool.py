@@ -0,0 +1,54 @@
+"""Tests for SSHConnectionPool reference counting."""
+
+import sys
+import threading
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from src.portpilot.core.ssh_pool import SSHConnectionPool, make_pool_key
+
+
+class _FakeTransport:
+    """Stands in for paramiko.Transport: active until closed, join() waits for close."""
+
+    def __init__(self):
+        self.closed = threading.Event()
+
+    def is_active(self) -> bool:
+        return not self.closed.is_set()
+
+    def close(self) -> None:
+        self.closed.set()
+
+    def join(self) -> None:
+        self.closed.wait()
+
+
+class SSHConnectionPoolTest(unittest.TestCase):
+    KEY = make_pool_key("example.com", 22, "user", "", "secret")
+
+    def test_failed_connect_does_not_leak_reference(self):
+        pool = SSHConnectionPool()
+
+        def fail():
+            raise OSError("unreachable")
+
+        with self.assertRaises(OSError):
+            pool.acquire(self.KEY, fail)
+
+        transport = _FakeTransport()
+        self.assertIs(pool.acquire(self.KEY, lambda: transport), transport)
+        pool.release(self.KEY)
+        self.assertFalse(transport.is_active())
+        self.assertEqual(pool._entries, {})
+
+    def test_key_depends_on_credentials(self):
+        self.assertEqual(self.KEY, make_pool_key("example.com", 22, "user", "", "secret"))
+        self.assertNotEqual(self.KEY, make_pool_key("example.com", 22, "user", "", "wrong"))
+        self.assertNotEqual(self.KEY, make_pool_key("example.com", 22, "user", "~/.ssh/id_ed25519", "secret"))
+
+
+if __name__ == "__main__":
+    unittest.main()